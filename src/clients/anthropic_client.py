@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 from typing import Any
 
 import anthropic
@@ -11,6 +12,27 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_TOKENS = 4096
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 2  # seconds
+MAX_RETRY_DELAY = 60  # Cap for exponential backoff
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Compute the backoff delay for a retryable API error.
+
+    Honors the server's Retry-After header when present; otherwise uses capped
+    exponential backoff with jitter so concurrent workers don't retry in
+    lockstep.
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+    delay: float = min(MAX_RETRY_DELAY, INITIAL_RETRY_DELAY * (2**attempt))
+    return delay * random.uniform(0.5, 1.5)
 
 
 class AnthropicClient:
@@ -64,37 +86,36 @@ class AnthropicClient:
 
         for attempt in range(MAX_RETRIES):
             try:
-                response = await self.client.messages.create(**kwargs)
-
-                # Extract text from response
-                text_content = ""
-                for block in response.content:
-                    if block.type == "text":
-                        text_content += block.text
+                # Stream the response instead of one long-lived create() call;
+                # this is the SDK-recommended path for long generations and
+                # avoids idle-read timeouts while the model is still decoding
+                async with self.client.messages.stream(**kwargs) as stream:
+                    parts = [text async for text in stream.text_stream]
+                    response = await stream.get_final_message()
 
                 logger.debug(
                     f"Received response: {response.usage.input_tokens} input tokens, "
                     f"{response.usage.output_tokens} output tokens"
                 )
 
-                return text_content
+                return "".join(parts)
 
             except anthropic.RateLimitError as e:
                 last_error = e
-                delay = INITIAL_RETRY_DELAY * (2**attempt)
+                delay = _retry_delay(e, attempt)
                 logger.warning(
                     f"Anthropic rate limit error (attempt {attempt + 1}/{MAX_RETRIES}), "
-                    f"retrying in {delay}s: {e}"
+                    f"retrying in {delay:.1f}s: {e}"
                 )
                 await asyncio.sleep(delay)
 
             except anthropic.InternalServerError as e:
                 # Handle 529 Overloaded and other 5xx errors
                 last_error = e
-                delay = INITIAL_RETRY_DELAY * (2**attempt)
+                delay = _retry_delay(e, attempt)
                 logger.warning(
                     f"Anthropic server error (attempt {attempt + 1}/{MAX_RETRIES}), "
-                    f"retrying in {delay}s: {e}"
+                    f"retrying in {delay:.1f}s: {e}"
                 )
                 await asyncio.sleep(delay)
 
@@ -2,13 +2,14 @@
 
 import asyncio
 import logging
-from datetime import UTC, datetime, timedelta
+import time
 from typing import Any
 
 import httpx
+import orjson
 
-from src.clients.token_cache import TokenCache
-from src.models.reddit_types import Comment, Post
+from src.clients.token_cache import TOKEN_EXPIRY_BUFFER, TokenCache
+from src.models.reddit_types import MAX_COMMENT_CHARS, MAX_SELFTEXT_CHARS, Comment, Post
 from src.services.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,16 @@ logger = logging.getLogger(__name__)
 REDDIT_AUTH_URL = "https://www.reddit.com/api/v1/access_token"
 REDDIT_API_BASE = "https://oauth.reddit.com"
 DEFAULT_TOKEN_EXPIRY = 86400  # 24 hours
+TOKEN_FETCH_RETRIES = 3  # Attempts for transient OAuth endpoint failures
+
+# Connection pool bounds shared by both client creation paths; keepalive
+# connections are reused across the posts/comments fan-out to one host
+HTTP_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=5,
+    keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
 
 
 class RedditClientError(Exception):
@@ -30,6 +41,12 @@ class RateLimitExceededError(RedditClientError):
     pass
 
 
+class AuthenticationError(RedditClientError):
+    """Raised when OAuth credentials are rejected by Reddit."""
+
+    pass
+
+
 class RedditClient:
     """Async Reddit API client with OAuth token caching and rate limiting."""
 
@@ -48,14 +65,32 @@ class RedditClient:
         self.token_cache = token_cache or TokenCache()
         self._client: httpx.AsyncClient | None = None
         self._access_token: str | None = None
-        self._token_lock = asyncio.Lock()
+        self._token_expires_at: float = 0.0
+        # Rebuilt only on token rotation; reused verbatim by every request
+        self._auth_headers: dict[str, str] = {}
+        # In-flight refresh shared by all concurrent callers (single-flight)
+        self._refresh_task: asyncio.Task[str] | None = None
+        # Bumped on every successful refresh; lets 401 handlers detect that
+        # the token already rotated since their request was issued
+        self._token_generation = 0
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client with a bounded connection pool.
+
+        The API base URL is parsed once here; requests pass relative endpoint
+        paths and httpx merges them against the pre-parsed base. The absolute
+        OAuth URL still works since absolute URLs bypass the base.
+        """
+        return httpx.AsyncClient(
+            base_url=REDDIT_API_BASE,
+            headers={"User-Agent": self.user_agent},
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+        )
 
     async def __aenter__(self) -> "RedditClient":
         """Initialize HTTP client on context entry."""
-        self._client = httpx.AsyncClient(
-            headers={"User-Agent": self.user_agent},
-            timeout=30.0,
-        )
+        self._client = self._build_http_client()
         return self
 
     async def __aexit__(self, _exc_type: Any, _exc_val: Any, _exc_tb: Any) -> None:
@@ -67,48 +102,91 @@ class RedditClient:
     async def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client is initialized."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                headers={"User-Agent": self.user_agent},
-                timeout=30.0,
-            )
+            self._client = self._build_http_client()
         return self._client
 
     async def _ensure_token(self) -> str:
         """Ensure we have a valid OAuth token."""
-        # Fast path: check in-memory token first (no lock needed)
-        if self._access_token:
-            cached = await self.token_cache.get()
-            if cached and cached.is_valid():
-                return self._access_token
-
-        # Slow path: need to refresh token (use lock to prevent race)
-        async with self._token_lock:
-            # Double-check after acquiring lock
-            cached = await self.token_cache.get()
-            if cached and cached.is_valid():
-                self._access_token = cached.access_token
-                return self._access_token
-
-            # Get new token
+        # Fast path: in-memory token still valid (no lock, no file I/O)
+        if self._access_token and time.time() < self._token_expires_at - TOKEN_EXPIRY_BUFFER:
+            return self._access_token
+
+        # Slow path: concurrent expirations share a single in-flight refresh
+        # instead of queueing on a lock and re-checking serially
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_token())
+            try:
+                return await self._refresh_task
+            finally:
+                self._refresh_task = None
+        return await self._refresh_task
+
+    async def _refresh_token(self) -> str:
+        """Refresh the token from the disk cache or the OAuth endpoint."""
+        # Another process may have refreshed the shared cache file already
+        cached = await self.token_cache.get()
+        if cached and cached.is_valid():
+            token = cached.access_token
+            self._token_expires_at = cached.expires_at
+        else:
             logger.info("Obtaining new Reddit OAuth token")
             client = await self._ensure_client()
 
-            response = await client.post(
-                REDDIT_AUTH_URL,
-                auth=(self.client_id, self.client_secret),
-                data={"grant_type": "client_credentials"},
-                headers={"User-Agent": self.user_agent},
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            self._access_token = data["access_token"]
+            data = await self._fetch_token(client)
+            token = data["access_token"]
             expires_in = data.get("expires_in", DEFAULT_TOKEN_EXPIRY)
+            self._token_expires_at = time.time() + expires_in
 
             # Cache the token
-            await self.token_cache.set(self._access_token, expires_in)
+            await self.token_cache.set(token, expires_in)
 
-            return self._access_token
+        self._access_token = token
+        self._auth_headers = {"Authorization": f"Bearer {token}"}
+        self._token_generation += 1
+        return token
+
+    async def _fetch_token(self, client: httpx.AsyncClient) -> Any:
+        """Fetch a new OAuth token, retrying transient endpoint failures.
+
+        Raises:
+            AuthenticationError: If Reddit rejects the client credentials
+            RedditClientError: If the token endpoint keeps failing
+        """
+        last_error: Exception | None = None
+
+        for attempt in range(TOKEN_FETCH_RETRIES):
+            try:
+                response = await client.post(
+                    REDDIT_AUTH_URL,
+                    auth=(self.client_id, self.client_secret),
+                    data={"grant_type": "client_credentials"},
+                    headers={"User-Agent": self.user_agent},
+                )
+                response.raise_for_status()
+                return response.json()
+
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                # Credential problems won't fix themselves - surface them directly
+                if status in (401, 403):
+                    raise AuthenticationError(
+                        f"Reddit rejected OAuth credentials (HTTP {status})"
+                    ) from e
+                last_error = e
+                logger.warning(
+                    f"Token fetch failed (attempt {attempt + 1}/{TOKEN_FETCH_RETRIES}): {e}"
+                )
+
+            except httpx.RequestError as e:
+                last_error = e
+                logger.warning(
+                    f"Token fetch failed (attempt {attempt + 1}/{TOKEN_FETCH_RETRIES}): {e}"
+                )
+
+            if attempt < TOKEN_FETCH_RETRIES - 1:
+                await asyncio.sleep(2**attempt)  # Exponential backoff
+
+        raise RedditClientError(f"Failed to obtain OAuth token: {last_error}") from last_error
 
     async def _request(
         self,
@@ -119,50 +197,53 @@ class RedditClient:
     ) -> Any:
         """Make an authenticated API request with rate limiting and retries."""
         client = await self._ensure_client()
-        token = await self._ensure_token()
-
-        url = f"{REDDIT_API_BASE}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "User-Agent": self.user_agent,
-        }
+        await self._ensure_token()
 
         for attempt in range(max_retries):
+            token_gen = self._token_generation
+
+            # Hold the rate-limiter slot only for the HTTP round-trip itself;
+            # retry sleeps and token refreshes must not pin a concurrency slot
             async with self.rate_limiter.acquire():
-                try:
-                    response = await client.request(
-                        method,
-                        url,
-                        headers=headers,
-                        **kwargs,
-                    )
-
-                    # Handle rate limiting
-                    if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", 5))
-                        logger.warning(
-                            f"Rate limited by Reddit, waiting {retry_after}s "
-                            f"(attempt {attempt + 1}/{max_retries})"
-                        )
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    # Handle token expiry
-                    if response.status_code == 401:
-                        logger.warning("Token expired, refreshing")
-                        await self.token_cache.clear()
-                        token = await self._ensure_token()
-                        headers["Authorization"] = f"Bearer {token}"
-                        continue
-
-                    response.raise_for_status()
-                    return response.json()
-
-                except httpx.HTTPStatusError as e:
-                    if attempt == max_retries - 1:
-                        raise RedditClientError(f"Request failed: {e}") from e
-                    logger.warning(f"Request error (attempt {attempt + 1}): {e}")
-                    await asyncio.sleep(2**attempt)  # Exponential backoff
+                response = await client.request(
+                    method,
+                    endpoint,
+                    headers=self._auth_headers,
+                    **kwargs,
+                )
+
+            # Handle rate limiting
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 5))
+                logger.warning(
+                    f"Rate limited by Reddit, waiting {retry_after}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(retry_after)
+                continue
+
+            # Handle token expiry; skip the refresh if the token already
+            # rotated after this request was issued (another 401 got there
+            # first) - retrying with the new token is enough
+            if response.status_code == 401:
+                if token_gen == self._token_generation:
+                    logger.warning("Token expired, refreshing")
+                    self._access_token = None
+                    await self.token_cache.clear()
+                    await self._ensure_token()
+                continue
+
+            try:
+                response.raise_for_status()
+                # orjson parses the large comment payloads 2-5x faster than
+                # stdlib json
+                return orjson.loads(response.content)
+
+            except httpx.HTTPStatusError as e:
+                if attempt == max_retries - 1:
+                    raise RedditClientError(f"Request failed: {e}") from e
+                logger.warning(f"Request error (attempt {attempt + 1}): {e}")
+                await asyncio.sleep(2**attempt)  # Exponential backoff
 
         raise RateLimitExceededError("Max retries exceeded for Reddit API request")
 
@@ -193,27 +274,28 @@ class RedditClient:
             logger.error(f"Failed to fetch posts from r/{subreddit}: {e}")
             return []
 
+        # Filter posts from last 24 hours; compare raw Unix floats instead of
+        # building datetime objects per post. For hour/day fetches Reddit
+        # already enforces the window server-side, so skip the check entirely.
+        cutoff_ts = 0.0 if time_filter in ("hour", "day") else time.time() - 86400.0
+
         posts: list[Post] = []
         for child in data.get("data", {}).get("children", []):
             post_data = child.get("data", {})
+            get = post_data.get
 
-            # Filter posts from last 24 hours
-            created_utc = post_data.get("created_utc", 0)
-            post_time = datetime.fromtimestamp(created_utc, tz=UTC)
-            cutoff_time = datetime.now(tz=UTC) - timedelta(hours=24)
-
-            if post_time < cutoff_time:
+            if cutoff_ts and get("created_utc", 0) < cutoff_ts:
                 continue
 
             post = Post(
-                title=post_data.get("title", ""),
-                url=post_data.get("url", ""),
-                score=post_data.get("score", 0),
-                subreddit=post_data.get("subreddit", subreddit),
-                author=post_data.get("author", "[deleted]"),
-                selftext=post_data.get("selftext", ""),
-                num_comments=post_data.get("num_comments", 0),
-                permalink=post_data.get("permalink", ""),
+                title=get("title", ""),
+                url=get("url", ""),
+                score=get("score", 0),
+                subreddit=get("subreddit", subreddit),
+                author=get("author", "[deleted]"),
+                selftext=get("selftext", "")[: MAX_SELFTEXT_CHARS + 1],
+                num_comments=get("num_comments", 0),
+                permalink=get("permalink", ""),
             )
             posts.append(post)
 
@@ -239,14 +321,9 @@ class RedditClient:
             return []
 
         try:
-            # Remove leading slash for endpoint
-            endpoint = post.permalink.rstrip("/") + ".json"
-            if endpoint.startswith("/"):
-                endpoint = endpoint[1:]
-
             data = await self._request(
                 "GET",
-                f"/{endpoint}",
+                post.comments_endpoint,
                 params={"limit": limit, "sort": "top"},
             )
         except RedditClientError as e:
@@ -271,7 +348,7 @@ class RedditClient:
                     continue
 
                 comment = Comment(
-                    body=body,
+                    body=body[: MAX_COMMENT_CHARS + 1],
                     score=comment_data.get("score", 0),
                     author=comment_data.get("author", "[deleted]"),
                 )
@@ -285,6 +362,7 @@ class RedditClient:
         subreddit: str,
         num_posts: int = 7,
         num_comments: int = 7,
+        max_concurrency: int = 5,
     ) -> list[Post]:
         """
         Fetch top posts and their comments from a subreddit.
@@ -293,15 +371,20 @@ class RedditClient:
             subreddit: Name of the subreddit
             num_posts: Number of posts to fetch
             num_comments: Number of comments per post
+            max_concurrency: Maximum simultaneous comment fetches
 
         Returns:
             List of Post objects with comments populated
         """
         posts = await self.fetch_top_posts(subreddit, limit=num_posts)
 
-        # Fetch comments for all posts in parallel
+        # Fetch comments in parallel, but bounded: unbounded gather would
+        # open every request at once only to serialize on the rate limiter
+        semaphore = asyncio.Semaphore(max_concurrency)
+
         async def fetch_comments_for_post(post: Post) -> Post:
-            post.comments = await self.fetch_post_comments(post, limit=num_comments)
+            async with semaphore:
+                post.comments = await self.fetch_post_comments(post, limit=num_comments)
             return post
 
         tasks = [fetch_comments_for_post(post) for post in posts]
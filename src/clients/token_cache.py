@@ -1,13 +1,15 @@
 """OAuth token caching for Reddit API."""
 
 import asyncio
-import json
+import contextlib
 import logging
+import os
+import tempfile
 import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
-import aiofiles
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +17,39 @@ DEFAULT_CACHE_PATH = ".token_cache.json"
 TOKEN_EXPIRY_BUFFER = 300  # Refresh 5 minutes before actual expiry
 
 
-@dataclass
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write payload to a sibling temp file and rename it over path.
+
+    os.replace is atomic on POSIX, so a concurrent reader sees either the
+    old file or the new one — never a truncated write.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+@dataclass(frozen=True, slots=True)
 class CachedToken:
     """Cached OAuth token with expiry information."""
 
     access_token: str
     expires_at: float  # Unix timestamp
 
-    def is_valid(self) -> bool:
-        """Check if token is still valid (with buffer time)."""
-        return time.time() < self.expires_at - TOKEN_EXPIRY_BUFFER
+    def is_valid(self, now: float | None = None) -> bool:
+        """Check if token is still valid (with buffer time).
+
+        Callers that already hold a timestamp can pass it as `now` to
+        avoid a redundant clock read.
+        """
+        if now is None:
+            now = time.time()
+        return now < self.expires_at - TOKEN_EXPIRY_BUFFER
 
 
 class TokenCache:
@@ -33,35 +58,47 @@ class TokenCache:
     def __init__(self, path: str = DEFAULT_CACHE_PATH):
         self.path = Path(path)
         self._lock = asyncio.Lock()
+        # Parsed token kept in memory; invalidated when the file's mtime moves
+        self._cached: CachedToken | None = None
+        self._cached_mtime: float = 0.0
 
     async def get(self) -> CachedToken | None:
         """Load cached token if it exists and is valid."""
         async with self._lock:
-            if not self.path.exists():
+            try:
+                mtime = (await asyncio.to_thread(os.stat, self.path)).st_mtime
+            except OSError:
                 logger.debug("Token cache file does not exist")
+                self._cached = None
+                self._cached_mtime = 0.0
                 return None
 
-            try:
-                async with aiofiles.open(self.path) as f:
-                    data = json.loads(await f.read())
+            if self._cached is not None and mtime == self._cached_mtime:
+                token = self._cached
+            else:
+                try:
+                    data = orjson.loads(await asyncio.to_thread(self.path.read_bytes))
                     token = CachedToken(
                         access_token=data["access_token"],
                         expires_at=data["expires_at"],
                     )
+                except (orjson.JSONDecodeError, KeyError) as e:
+                    logger.warning(f"Failed to read token cache: {e}")
+                    return None
 
-                    if token.is_valid():
-                        logger.debug(
-                            "Using cached token (expires in %.0f seconds)",
-                            token.expires_at - time.time(),
-                        )
-                        return token
-                    else:
-                        logger.debug("Cached token has expired")
-                        return None
-
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to read token cache: {e}")
-                return None
+                self._cached = token
+                self._cached_mtime = mtime
+
+            now = time.time()
+            if token.is_valid(now):
+                logger.debug(
+                    "Using cached token (expires in %.0f seconds)",
+                    token.expires_at - now,
+                )
+                return token
+
+            logger.debug("Cached token has expired")
+            return None
 
     async def set(self, access_token: str, expires_in: int) -> None:
         """Save a new token to the cache."""
@@ -72,14 +109,21 @@ class TokenCache:
             )
 
             try:
-                async with aiofiles.open(self.path, mode="w") as f:
-                    await f.write(json.dumps(asdict(cached), indent=2))
+                payload = orjson.dumps(asdict(cached), option=orjson.OPT_INDENT_2)
+                await asyncio.to_thread(_atomic_write_bytes, self.path, payload)
+                self._cached = cached
+                self._cached_mtime = (await asyncio.to_thread(os.stat, self.path)).st_mtime
                 logger.info(f"Token cached successfully (expires in {expires_in}s)")
             except OSError as e:
                 logger.error(f"Failed to write token cache: {e}")
 
     async def clear(self) -> None:
         """Remove the cached token."""
-        if self.path.exists():
-            self.path.unlink()
+        self._cached = None
+        self._cached_mtime = 0.0
+        try:
+            await asyncio.to_thread(self.path.unlink)
+        except FileNotFoundError:
+            pass
+        else:
             logger.debug("Token cache cleared")
@@ -1,5 +1,6 @@
 """Discord slash commands for news fetching."""
 
+import asyncio
 import io
 import logging
 from datetime import date
@@ -17,6 +18,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of /news invocations processed at once; the rest queue up
+# instead of opening unbounded parallel Reddit + Anthropic pipelines
+MAX_CONCURRENT_INVOCATIONS = 3
+
+# Maximum groups fetched + summarized in parallel within one /news invocation
+MAX_CONCURRENT_GROUPS = 3
+
 
 class NewsCog(commands.Cog):
     """Discord cog for news-related commands."""
@@ -32,8 +40,19 @@ class NewsCog(commands.Cog):
         self.fetcher = fetcher
         self.summarizer = summarizer
         self.default_model = default_model
-        # Guild-specific model settings (in-memory)
-        self.model_settings: dict[int, str] = {}
+        # Guild-specific model settings (in-memory); keyed by guild id, and
+        # a None guild id (DMs) simply misses and falls back to the default
+        self.model_settings: dict[int | None, str] = {}
+        # Bound concurrent /news pipelines to protect against request storms
+        self._invocation_sem = asyncio.Semaphore(MAX_CONCURRENT_INVOCATIONS)
+        # Group config is static for the bot's lifetime; snapshot it once
+        # instead of re-copying from the fetcher on every command
+        self._available_groups = fetcher.get_available_groups()
+        # Display labels derived from the static group names, built once
+        self._group_labels = {g: g.upper() for g in self._available_groups}
+        # Ready-made group list for /news all, instead of rebuilding from
+        # dict keys on every invocation
+        self._all_group_names = list(self._available_groups)
 
         # Create news command group with dynamic subcommands
         news_group = app_commands.Group(
@@ -41,7 +60,7 @@ class NewsCog(commands.Cog):
         )
 
         # Add subcommand for each available group
-        for group_name in sorted(fetcher.get_available_groups().keys()):
+        for group_name in sorted(self._available_groups.keys()):
             self._add_group_subcommand(news_group, group_name)
 
         # Add "all" subcommand to fetch all groups
@@ -61,8 +80,6 @@ class NewsCog(commands.Cog):
 
     def _get_model(self, guild_id: int | None) -> str:
         """Get the model setting for a guild."""
-        if guild_id is None:
-            return self.default_model
         return self.model_settings.get(guild_id, self.default_model)
 
     async def _fetch_news(
@@ -71,8 +88,15 @@ class NewsCog(commands.Cog):
         """Fetch and summarize Reddit news for specified groups."""
         await interaction.response.defer()
 
+        async with self._invocation_sem:
+            await self._process_news(interaction, target_groups)
+
+    async def _process_news(
+        self, interaction: "Interaction", target_groups: list[str] | None
+    ) -> None:
+        """Run the fetch + summarize pipeline for the requested groups."""
         try:
-            available_groups = self.fetcher.get_available_groups()
+            available_groups = self._available_groups
 
             if not available_groups:
                 await interaction.followup.send(
@@ -83,7 +107,7 @@ class NewsCog(commands.Cog):
 
             # Use all groups if none specified
             if target_groups is None:
-                target_groups = list(available_groups.keys())
+                target_groups = self._all_group_names
 
             guild_id = interaction.guild_id
             model = self._get_model(guild_id)
@@ -92,42 +116,62 @@ class NewsCog(commands.Cog):
                 f"Завантаження новин для груп(и): {', '.join(target_groups)}..."
             )
 
-            for grp in target_groups:
-                try:
+            # Fetch + summarize groups in parallel (bounded); each group's
+            # pipeline is independent, so /news all no longer pays the sum
+            # of per-group latencies
+            group_sem = asyncio.Semaphore(MAX_CONCURRENT_GROUPS)
+
+            async def process_group(grp: str) -> str | None:
+                label = self._group_labels.get(grp, grp.upper())
+
+                async with group_sem:
                     subreddit_group = await self.fetcher.fetch_group(grp)
 
                     if not subreddit_group.posts:
-                        await interaction.followup.send(
-                            f"**{grp.upper()}**: Не знайдено постів за останні 24 години."
-                        )
-                        continue
+                        return None
 
                     await interaction.followup.send(
-                        f"Знайдено {len(subreddit_group.posts)} постів для **{grp.upper()}**. "
+                        f"Знайдено {len(subreddit_group.posts)} постів для **{label}**. "
                         f"Генерую підсумок..."
                     )
 
-                    summary = await self.summarizer.summarize_and_translate(
+                    return await self.summarizer.summarize_and_translate(
                         group_name=grp,
                         posts=subreddit_group.posts,
                         model=model,
                     )
 
-                    file = discord.File(
-                        fp=io.BytesIO(summary.encode("utf-8")),
-                        filename=f"{grp}_news_{date.today().isoformat()}.txt",
-                    )
+            results = await asyncio.gather(
+                *(process_group(grp) for grp in target_groups),
+                return_exceptions=True,
+            )
 
+            # Deliver results serially so attachments arrive in request order
+            for grp, result in zip(target_groups, results):
+                label = self._group_labels.get(grp, grp.upper())
+
+                if isinstance(result, BaseException):
+                    logger.error(f"Error processing group '{grp}': {result}")
                     await interaction.followup.send(
-                        content=f"**{grp.upper()}**",
-                        file=file,
+                        f"Помилка завантаження новин для **{grp}**: {result}"
                     )
+                    continue
 
-                except Exception as e:
-                    logger.exception(f"Error processing group '{grp}'")
+                if result is None:
                     await interaction.followup.send(
-                        f"Помилка завантаження новин для **{grp}**: {e}"
+                        f"**{label}**: Не знайдено постів за останні 24 години."
                     )
+                    continue
+
+                file = discord.File(
+                    fp=io.BytesIO(result.encode("utf-8")),
+                    filename=f"{grp}_news_{date.today().isoformat()}.txt",
+                )
+
+                await interaction.followup.send(
+                    content=f"**{label}**",
+                    file=file,
+                )
 
         except Exception as e:
             logger.exception("Error in /news command")
@@ -146,9 +190,8 @@ class NewsCog(commands.Cog):
             )
             return
 
-        # Basic validation
-        valid_prefixes = ("claude-", "claude-3", "claude-sonnet", "claude-opus", "claude-haiku")
-        if not any(model.startswith(prefix) for prefix in valid_prefixes):
+        # Basic validation; every Anthropic model name starts with "claude-"
+        if not model.startswith("claude-"):
             await interaction.response.send_message(
                 f"Недійсна назва моделі: `{model}`. Назва моделі повинна починатися з 'claude-'.",
                 ephemeral=True,
@@ -172,7 +215,7 @@ class NewsCog(commands.Cog):
     @app_commands.command(name="groups", description="Показати доступні групи новин")
     async def groups(self, interaction: "Interaction") -> None:
         """List available subreddit groups."""
-        available_groups = self.fetcher.get_available_groups()
+        available_groups = self._available_groups
 
         if not available_groups:
             await interaction.response.send_message("Групи сабредітів не налаштовані.")
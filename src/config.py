@@ -5,12 +5,20 @@ import os
 import re
 from dataclasses import dataclass, field
 
-from dotenv import load_dotenv
-
 logger = logging.getLogger(__name__)
 
+# Prefix for SUB_<GROUPNAME> environment variables; the name itself must be
+# uppercase ASCII letters, digits, and underscores (compiled once — group
+# names become slash-command names, so anything looser would crash the cog)
+SUB_GROUP_PREFIX = "SUB_"
+SUB_GROUP_NAME_RE = re.compile(r"[A-Z0-9_]+")
+
+# .env is loaded at most once per process; repeated from_env() calls
+# (frequent in tests) skip the dotenv import and file probe entirely
+_dotenv_loaded = False
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Application configuration loaded from environment variables."""
 
@@ -42,7 +50,12 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
-        load_dotenv()
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _dotenv_loaded = True
 
         # Required variables
         discord_token = os.environ.get("DISCORD_TOKEN")
@@ -93,15 +106,20 @@ class Config:
     def _parse_subreddit_groups() -> dict[str, list[str]]:
         """Parse SUB_<GROUPNAME>=sub1,sub2,sub3 from environment."""
         groups: dict[str, list[str]] = {}
-        pattern = re.compile(r"^SUB_([A-Z0-9_]+)$")
 
         for key, value in os.environ.items():
-            match = pattern.match(key)
-            if match:
-                group_name = match.group(1).lower()
-                subreddits = [s.strip() for s in value.split(",") if s.strip()]
-                if subreddits:
-                    groups[group_name] = subreddits
-                    logger.info(f"Found subreddit group '{group_name}': {subreddits}")
+            if not key.startswith(SUB_GROUP_PREFIX):
+                continue
+
+            name = key[len(SUB_GROUP_PREFIX) :]
+            if not SUB_GROUP_NAME_RE.fullmatch(name):
+                continue
+
+            group_name = name.lower()
+            # Strip each token once; the generator keeps it a single pass
+            subreddits = [s for s in (t.strip() for t in value.split(",")) if s]
+            if subreddits:
+                groups[group_name] = subreddits
+                logger.info(f"Found subreddit group '{group_name}': {subreddits}")
 
         return groups
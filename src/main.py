@@ -1,8 +1,11 @@
 """Main entry point for the SubTrends Discord bot."""
 
 import asyncio
+import hashlib
+import json
 import logging
 import sys
+from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -29,6 +32,10 @@ logging.getLogger("anthropic").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+# Stores the signature of the last successfully synced command tree so
+# reconnects and restarts with unchanged commands skip the sync round-trips
+COMMAND_SYNC_HASH_PATH = Path(".command_sync_hash")
+
 
 async def main() -> None:
     """Initialize and run the Discord bot."""
@@ -84,9 +91,27 @@ async def main() -> None:
         if bot.user:
             logger.info(f"Logged in as {bot.user} (ID: {bot.user.id})")
 
-        # Sync slash commands
+        # Sync slash commands, but only when their definitions changed;
+        # on_ready also fires on reconnects and unconditional syncs burn
+        # Discord rate-limit budget for no effect
         try:
+            payload = json.dumps(
+                [cmd.to_dict(bot.tree) for cmd in bot.tree.get_commands()],
+                sort_keys=True,
+            )
+            signature = hashlib.sha256(payload.encode()).hexdigest()
+
+            try:
+                last_synced = (await asyncio.to_thread(COMMAND_SYNC_HASH_PATH.read_text)).strip()
+            except OSError:
+                last_synced = ""
+
+            if signature == last_synced:
+                logger.info("Slash commands unchanged, skipping sync")
+                return
+
             synced = await bot.tree.sync()
+            await asyncio.to_thread(COMMAND_SYNC_HASH_PATH.write_text, signature)
             logger.info(f"Synced {len(synced)} slash commands")
         except Exception as e:
             logger.error(f"Failed to sync commands: {e}")
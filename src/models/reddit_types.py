@@ -2,8 +2,15 @@
 
 from dataclasses import dataclass, field
 
+# How much of a post's selftext / a comment's body the summary prompt uses.
+# The Reddit client clips bodies to one char beyond these limits at fetch
+# time, so full 50KB selftexts never travel through the pipeline while the
+# prompt builder can still detect (and mark) clipped content.
+MAX_SELFTEXT_CHARS = 1000
+MAX_COMMENT_CHARS = 500
 
-@dataclass
+
+@dataclass(slots=True)
 class Comment:
     """A Reddit comment."""
 
@@ -15,7 +22,7 @@ class Comment:
         return f"[{self.score}] {self.author}: {self.body[:100]}..."
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """A Reddit post with its top comments."""
 
@@ -28,19 +35,26 @@ class Post:
     num_comments: int = 0
     permalink: str = ""
     comments: list[Comment] = field(default_factory=list)
+    # Derived once from permalink at construction instead of rebuilt on
+    # every access (cached_property needs a __dict__, which slots removes)
+    comments_endpoint: str = field(init=False, default="")
+    full_url: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        if self.permalink:
+            path = self.permalink.rstrip("/")
+            if not path.startswith("/"):
+                path = "/" + path
+            self.comments_endpoint = f"{path}.json"
+            self.full_url = f"https://reddit.com{self.permalink}"
+        else:
+            self.full_url = self.url
 
     def __str__(self) -> str:
         return f"[{self.score}] r/{self.subreddit}: {self.title}"
 
-    @property
-    def full_url(self) -> str:
-        """Get the full Reddit URL for this post."""
-        if self.permalink:
-            return f"https://reddit.com{self.permalink}"
-        return self.url
-
 
-@dataclass
+@dataclass(slots=True)
 class SubredditGroup:
     """A group of subreddits with their fetched posts."""
 
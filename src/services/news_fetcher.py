@@ -2,12 +2,19 @@
 
 import asyncio
 import logging
+import random
+import time
+from operator import attrgetter
+from types import MappingProxyType
 
 from src.clients.reddit import RedditClient
 from src.models.reddit_types import Post, SubredditGroup
 
 logger = logging.getLogger(__name__)
 
+POST_CACHE_TTL = 600  # Base seconds to reuse fetched posts per subreddit
+POST_CACHE_JITTER = 0.1  # Spread expiries +-10% so they don't align
+
 
 class NewsFetcher:
     """Orchestrates fetching Reddit posts and comments for subreddit groups."""
@@ -32,10 +39,20 @@ class NewsFetcher:
         self.subreddit_groups = subreddit_groups
         self.num_posts = num_posts
         self.num_comments = num_comments
-
-    def get_available_groups(self) -> dict[str, list[str]]:
-        """Return the available subreddit groups."""
-        return self.subreddit_groups.copy()
+        # In-flight fetches shared by concurrent callers (single-flight);
+        # two /news invocations for the same group join one Reddit crawl
+        self._inflight: dict[str, asyncio.Task[SubredditGroup]] = {}
+        # Read-only view handed to callers; avoids a defensive dict copy
+        # on every command invocation
+        self._groups_view = MappingProxyType(subreddit_groups)
+        # Fetched posts per subreddit with jittered expiry; overlapping
+        # groups and back-to-back /news calls reuse one Reddit crawl, and
+        # the jitter keeps entries from all expiring in the same instant
+        self._post_cache: dict[str, tuple[float, list[Post]]] = {}
+
+    def get_available_groups(self) -> MappingProxyType[str, list[str]]:
+        """Return a read-only view of the available subreddit groups."""
+        return self._groups_view
 
     async def fetch_group(self, group_name: str) -> SubredditGroup:
         """
@@ -56,41 +73,73 @@ class NewsFetcher:
             available = ", ".join(self.subreddit_groups.keys())
             raise ValueError(f"Unknown group '{group_name}'. Available groups: {available}")
 
-        subreddits = self.subreddit_groups[group_name_lower]
+        # Key on a coarse time bucket so a crawl started near a window edge
+        # is not joined by callers expecting materially fresher data
+        key = f"{group_name_lower}:{int(time.time() // 300)}"
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_group(group_name_lower))
+            self._inflight[key] = task
+            try:
+                return await task
+            finally:
+                self._inflight.pop(key, None)
+        return await task
+
+    async def _fetch_group(self, group_name: str) -> SubredditGroup:
+        """Run the actual crawl for a group (already lower-cased and validated)."""
+        subreddits = self.subreddit_groups[group_name]
         logger.info(f"Fetching news for group '{group_name}' from {len(subreddits)} subreddits")
 
-        # Fetch posts from all subreddits in parallel
-        tasks = [self._fetch_subreddit(subreddit) for subreddit in subreddits]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Fetch posts from all subreddits in parallel. Tolerable per-subreddit
+        # failures are absorbed inside _fetch_subreddit; anything that escapes
+        # is unexpected, and the TaskGroup cancels the sibling fetches instead
+        # of letting them run on to completion
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._fetch_subreddit(s)) for s in subreddits]
 
-        # Collect successful results
         all_posts: list[Post] = []
-        for subreddit, result in zip(subreddits, results):
-            if isinstance(result, BaseException):
-                logger.error(f"Failed to fetch r/{subreddit}: {result}")
-                continue
-            all_posts.extend(result)
+        for task in tasks:
+            all_posts.extend(task.result())
 
         # Sort by score descending
-        all_posts.sort(key=lambda p: p.score, reverse=True)
+        all_posts.sort(key=attrgetter("score"), reverse=True)
 
         logger.info(f"Fetched total of {len(all_posts)} posts for group '{group_name}'")
 
         return SubredditGroup(
-            name=group_name_lower,
+            name=group_name,
             subreddits=subreddits,
             posts=all_posts,
         )
 
     async def _fetch_subreddit(self, subreddit: str) -> list[Post]:
         """Fetch posts with comments from a single subreddit."""
+        now = time.monotonic()
+        cached = self._post_cache.get(subreddit)
+        if cached and now < cached[0]:
+            logger.debug(f"Using cached posts for r/{subreddit}")
+            return cached[1]
+
         logger.debug(f"Fetching from r/{subreddit}")
 
-        posts = await self.reddit_client.fetch_posts_with_comments(
-            subreddit=subreddit,
-            num_posts=self.num_posts,
-            num_comments=self.num_comments,
-        )
+        try:
+            posts = await self.reddit_client.fetch_posts_with_comments(
+                subreddit=subreddit,
+                num_posts=self.num_posts,
+                num_comments=self.num_comments,
+            )
+        except Exception as e:
+            # A single bad subreddit degrades to an empty result; the group
+            # still summarizes what the others returned. Failures are not
+            # cached, so the next crawl retries.
+            logger.error(f"Failed to fetch r/{subreddit}: {e}")
+            return []
+
+        ttl = POST_CACHE_TTL * random.uniform(1 - POST_CACHE_JITTER, 1 + POST_CACHE_JITTER)
+        self._post_cache = {k: v for k, v in self._post_cache.items() if now < v[0]}
+        self._post_cache[subreddit] = (now + ttl, posts)
 
         logger.debug(f"Fetched {len(posts)} posts from r/{subreddit}")
         return posts
@@ -42,18 +42,23 @@ class RateLimiter:
 
     async def _wait_for_rate_limit(self) -> None:
         """Wait if we've exceeded the requests-per-minute limit."""
-        async with self._lock:
-            now = time.monotonic()
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+
+                # Record the request if the window has room
+                if len(self.request_times) < self.requests_per_minute:
+                    self.request_times.append(now)
+                    return
 
-            # Check if we need to wait for rate limit window
-            if len(self.request_times) >= self.requests_per_minute:
                 oldest = self.request_times[0]
-                time_since_oldest = now - oldest
+                wait_time = 60 - (now - oldest)
 
-                if time_since_oldest < 60:
-                    wait_time = 60 - time_since_oldest
-                    logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
-                    await asyncio.sleep(wait_time)
+                if wait_time <= 0:
+                    self.request_times.append(now)
+                    return
 
-            # Record this request
-            self.request_times.append(time.monotonic())
+            # Sleep outside the lock so one sleeper doesn't serialize every
+            # other caller; re-check the window after waking
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
@@ -1,9 +1,11 @@
 """News summarization and translation service."""
 
+import hashlib
 import logging
+import time
 
 from src.clients.anthropic_client import AnthropicClient
-from src.models.reddit_types import Post
+from src.models.reddit_types import MAX_COMMENT_CHARS, MAX_SELFTEXT_CHARS, Post
 
 logger = logging.getLogger(__name__)
 
@@ -39,20 +41,40 @@ Translate the following text to Ukrainian:
 
 Provide only the translation, no explanations or notes."""
 
+# Single-call variant: summarize straight into Ukrainian, folding the
+# translation rules in so the second round-trip is skipped entirely
+COMBINED_SYSTEM = (
+    SUMMARIZER_SYSTEM
+    + """
+
+Write the summary directly in Ukrainian:
+1. Use standard Ukrainian (literary language, not Surzhyk)
+2. Transliterate proper nouns appropriately (use Ukrainian conventions)
+3. For technical terms, use commonly accepted Ukrainian equivalents
+4. Keep the ASCII formatting rules above"""
+)
+
 MAX_CONTENT_LENGTH = 100000  # Max chars to send to API
+SUMMARY_CACHE_TTL = 3600  # Seconds to reuse a summary for identical content
 
 
 class Summarizer:
     """Service for summarizing Reddit posts and translating to Ukrainian."""
 
-    def __init__(self, client: AnthropicClient):
+    def __init__(self, client: AnthropicClient, two_step: bool = False):
         """
         Initialize the summarizer.
 
         Args:
             client: AnthropicClient instance
+            two_step: Summarize and translate in separate API calls instead
+                of one combined call (slower; kept for quality comparison)
         """
         self.client = client
+        self.two_step = two_step
+        # TTL cache of finished summaries keyed by (group, model, content) hash;
+        # avoids paying API latency and spend for back-to-back identical requests
+        self._summary_cache: dict[str, tuple[float, str]] = {}
 
     async def summarize(
         self,
@@ -76,6 +98,13 @@ class Summarizer:
 
         prompt = self._build_summary_prompt(group_name, posts)
 
+        cache_key = self._cache_key(group_name, prompt, model)
+        now = time.monotonic()
+        cached = self._summary_cache.get(cache_key)
+        if cached and now < cached[0]:
+            logger.info(f"Using cached summary for group '{group_name}'")
+            return cached[1]
+
         logger.info(f"Summarizing {len(posts)} posts for group '{group_name}'")
 
         summary = await self.client.generate(
@@ -84,6 +113,10 @@ class Summarizer:
             model=model,
         )
 
+        # Store the result and drop any entries that have expired
+        self._summary_cache = {k: v for k, v in self._summary_cache.items() if now < v[0]}
+        self._summary_cache[cache_key] = (now + SUMMARY_CACHE_TTL, summary)
+
         return summary
 
     async def translate_to_ukrainian(
@@ -104,6 +137,15 @@ class Summarizer:
         if not text:
             return ""
 
+        # Cache translations alongside summaries: a cached summary would
+        # otherwise still pay a full translation round-trip
+        cache_key = self._cache_key("translate", text, model)
+        now = time.monotonic()
+        cached = self._summary_cache.get(cache_key)
+        if cached and now < cached[0]:
+            logger.info("Using cached Ukrainian translation")
+            return cached[1]
+
         logger.info("Translating summary to Ukrainian")
 
         translation = await self.client.generate(
@@ -112,6 +154,9 @@ class Summarizer:
             model=model,
         )
 
+        self._summary_cache = {k: v for k, v in self._summary_cache.items() if now < v[0]}
+        self._summary_cache[cache_key] = (now + SUMMARY_CACHE_TTL, translation)
+
         return translation
 
     async def summarize_and_translate(
@@ -131,52 +176,111 @@ class Summarizer:
         Returns:
             Summarized and translated news in Ukrainian
         """
-        # Step 1: Summarize
-        summary = await self.summarize(group_name, posts, model)
-
-        # Step 2: Translate
-        translation = await self.translate_to_ukrainian(summary, model)
+        if self.two_step:
+            summary = await self.summarize(group_name, posts, model)
+            translation = await self.translate_to_ukrainian(summary, model)
+        else:
+            # One combined call halves the LLM round-trips on the hot path
+            translation = await self._summarize_in_ukrainian(group_name, posts, model)
 
         # Step 3: Append source URLs
         if posts:
-            urls_section = "\n\n════════════════════════════════════════\n"
-            urls_section += "ДЖЕРЕЛА\n"
-            urls_section += "════════════════════════════════════════\n\n"
+            url_lines = [
+                "\n\n════════════════════════════════════════\n"
+                "ДЖЕРЕЛА\n"
+                "════════════════════════════════════════\n\n"
+            ]
             for post in posts:
                 title = post.title[:60] + "..." if len(post.title) > 60 else post.title
-                urls_section += f"• {title}\n  {post.full_url}\n\n"
-            translation += urls_section
+                url_lines.append(f"• {title}\n  {post.full_url}\n\n")
+            translation += "".join(url_lines)
 
         return translation
 
+    async def _summarize_in_ukrainian(
+        self,
+        group_name: str,
+        posts: list[Post],
+        model: str | None = None,
+    ) -> str:
+        """Summarize posts directly into Ukrainian with a single API call."""
+        if not posts:
+            return f"Не знайдено постів для групи '{group_name}' за останні 24 години."
+
+        prompt = self._build_summary_prompt(group_name, posts)
+
+        # Namespaced separately from the English summaries of the same prompt
+        cache_key = self._cache_key(f"uk:{group_name}", prompt, model)
+        now = time.monotonic()
+        cached = self._summary_cache.get(cache_key)
+        if cached and now < cached[0]:
+            logger.info(f"Using cached Ukrainian summary for group '{group_name}'")
+            return cached[1]
+
+        logger.info(f"Summarizing {len(posts)} posts for group '{group_name}' in Ukrainian")
+
+        summary = await self.client.generate(
+            prompt=prompt,
+            system=COMBINED_SYSTEM,
+            model=model,
+        )
+
+        self._summary_cache = {k: v for k, v in self._summary_cache.items() if now < v[0]}
+        self._summary_cache[cache_key] = (now + SUMMARY_CACHE_TTL, summary)
+
+        return summary
+
+    @staticmethod
+    def _cache_key(group_name: str, prompt: str, model: str | None) -> str:
+        """Build a compact cache key from the group, model, and prompt content."""
+        digest = hashlib.blake2b(
+            f"{group_name}|{model}|{prompt}".encode(),
+            digest_size=16,
+        )
+        return digest.hexdigest()
+
     def _build_summary_prompt(self, group_name: str, posts: list[Post]) -> str:
         """Build the prompt for summarization."""
-        sections: list[str] = []
+        # Accumulate flat string parts and join once; avoids quadratic
+        # string concatenation for large post sets. A running length lets us
+        # stop formatting posts that the final truncation would cut anyway.
+        parts: list[str] = []
+        total_len = 0
 
         for i, post in enumerate(posts, 1):
-            section = f"## Post {i}: {post.title}\n"
-            section += f"**Subreddit:** r/{post.subreddit} | **Score:** {post.score}\n\n"
+            if total_len > MAX_CONTENT_LENGTH:
+                break
+
+            section_start = len(parts)
+
+            if parts:
+                parts.append("\n---\n\n")
+            parts.append(f"## Post {i}: {post.title}\n")
+            parts.append(f"**Subreddit:** r/{post.subreddit} | **Score:** {post.score}\n\n")
 
             # Include selftext if available (for text posts)
             if post.selftext and post.selftext.strip():
-                selftext = post.selftext[:1000]  # Limit selftext
-                if len(post.selftext) > 1000:
-                    selftext += "..."
-                section += f"**Content:**\n{selftext}\n\n"
+                selftext = (
+                    post.selftext
+                    if len(post.selftext) <= MAX_SELFTEXT_CHARS
+                    else post.selftext[:MAX_SELFTEXT_CHARS] + "..."
+                )
+                parts.append(f"**Content:**\n{selftext}\n\n")
 
             # Include top comments
             if post.comments:
-                section += "**Top Comments:**\n"
+                parts.append("**Top Comments:**\n")
                 for j, comment in enumerate(post.comments, 1):
-                    # Limit comment length
-                    body = comment.body[:500]
-                    if len(comment.body) > 500:
-                        body += "..."
-                    section += f"{j}. [{comment.score} points] {body}\n"
+                    body = (
+                        comment.body
+                        if len(comment.body) <= MAX_COMMENT_CHARS
+                        else comment.body[:MAX_COMMENT_CHARS] + "..."
+                    )
+                    parts.append(f"{j}. [{comment.score} points] {body}\n")
 
-            sections.append(section)
+            total_len += sum(len(part) for part in parts[section_start:])
 
-        content = "\n---\n\n".join(sections)
+        content = "".join(parts)
 
         # Truncate if too long
         if len(content) > MAX_CONTENT_LENGTH:
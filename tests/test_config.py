@@ -1,164 +1,132 @@
 """Tests for configuration management."""
 
 import os
+from collections.abc import Iterator
+from types import MappingProxyType
 from unittest.mock import patch
 
 import pytest
 
 from src.config import Config
 
+# Baseline of the four required variables, shared (read-only) across tests
+# instead of rebuilding near-identical env dicts per test
+_REQUIRED_ENV = MappingProxyType(
+    {
+        "DISCORD_TOKEN": "token",
+        "REDDIT_CLIENT_ID": "id",
+        "REDDIT_CLIENT_SECRET": "secret",
+        "ANTHROPIC_API_KEY": "key",
+    }
+)
 
-# Mock load_dotenv to prevent loading .env file during tests
+
+# Mock load_dotenv to prevent loading .env file during tests; the import
+# is lazy inside from_env now, so patch it on the dotenv package itself
 @pytest.fixture(autouse=True)
-def mock_dotenv() -> None:
-    with patch("src.config.load_dotenv"):
+def mock_dotenv() -> Iterator[None]:
+    with patch("dotenv.load_dotenv"):
         yield
 
 
-class TestConfigParseSubredditGroups:
-    """Tests for subreddit group parsing from environment variables."""
-
-    def test_parse_single_group(self) -> None:
-        env = {"SUB_WORLD": "news,worldnews,europe"}
-
-        with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
-
-        assert "world" in groups
-        assert groups["world"] == ["news", "worldnews", "europe"]
-
-    def test_parse_multiple_groups(self) -> None:
-        env = {
-            "SUB_WORLD": "news,worldnews",
-            "SUB_TECH": "programming,webdev",
-            "SUB_SCIENCE": "science,askscience",
-        }
-
-        with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
-
-        assert len(groups) == 3
-        assert groups["world"] == ["news", "worldnews"]
-        assert groups["tech"] == ["programming", "webdev"]
-        assert groups["science"] == ["science", "askscience"]
-
-    def test_group_name_lowercase(self) -> None:
-        env = {"SUB_MYGROUP": "sub1,sub2"}
-
-        with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
-
-        assert "mygroup" in groups
-        assert "MYGROUP" not in groups
-
-    def test_strips_whitespace(self) -> None:
-        env = {"SUB_TEST": "  news  ,  worldnews  ,  europe  "}
-
-        with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
-
-        assert groups["test"] == ["news", "worldnews", "europe"]
-
-    def test_ignores_empty_subreddits(self) -> None:
-        env = {"SUB_TEST": "news,,worldnews,,,europe,"}
-
-        with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
-
-        assert groups["test"] == ["news", "worldnews", "europe"]
-
-    def test_ignores_non_sub_env_vars(self) -> None:
-        env = {
-            "SUB_WORLD": "news",
-            "DISCORD_TOKEN": "secret",
-            "OTHER_VAR": "value",
-            "SUBMARINE": "not_a_group",
-        }
-
-        with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
-
-        assert len(groups) == 1
-        assert "world" in groups
-
-    def test_empty_value_not_added(self) -> None:
-        env = {"SUB_EMPTY": ""}
-
-        with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
-
-        assert "empty" not in groups
-
-    def test_whitespace_only_value_not_added(self) -> None:
-        env = {"SUB_WHITESPACE": "   ,   ,   "}
-
-        with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
-
-        assert "whitespace" not in groups
+# Parsed configs memoized per distinct env shape so tests sharing an env
+# don't re-scan os.environ; only successful parses are cached
+_config_cache: dict[frozenset[tuple[str, str]], Config] = {}
 
-    def test_underscore_in_group_name(self) -> None:
-        env = {"SUB_MY_GROUP_NAME": "sub1,sub2"}
 
+def make_config(env: dict[str, str]) -> Config:
+    key = frozenset(env.items())
+    config = _config_cache.get(key)
+    if config is None:
         with patch.dict(os.environ, env, clear=True):
-            groups = Config._parse_subreddit_groups()
+            config = Config.from_env()
+        _config_cache[key] = config
+    return config
 
-        assert "my_group_name" in groups
 
-    def test_numbers_in_group_name(self) -> None:
-        env = {"SUB_GROUP123": "sub1,sub2"}
+class TestConfigParseSubredditGroups:
+    """Tests for subreddit group parsing from environment variables."""
 
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            pytest.param(
+                {"SUB_WORLD": "news,worldnews,europe"},
+                {"world": ["news", "worldnews", "europe"]},
+                id="single_group",
+            ),
+            pytest.param(
+                {
+                    "SUB_WORLD": "news,worldnews",
+                    "SUB_TECH": "programming,webdev",
+                    "SUB_SCIENCE": "science,askscience",
+                },
+                {
+                    "world": ["news", "worldnews"],
+                    "tech": ["programming", "webdev"],
+                    "science": ["science", "askscience"],
+                },
+                id="multiple_groups",
+            ),
+            pytest.param(
+                {"SUB_MYGROUP": "sub1,sub2"},
+                {"mygroup": ["sub1", "sub2"]},
+                id="group_name_lowercase",
+            ),
+            pytest.param(
+                {"SUB_TEST": "  news  ,  worldnews  ,  europe  "},
+                {"test": ["news", "worldnews", "europe"]},
+                id="strips_whitespace",
+            ),
+            pytest.param(
+                {"SUB_TEST": "news,,worldnews,,,europe,"},
+                {"test": ["news", "worldnews", "europe"]},
+                id="ignores_empty_subreddits",
+            ),
+            pytest.param(
+                {
+                    "SUB_WORLD": "news",
+                    "DISCORD_TOKEN": "secret",
+                    "OTHER_VAR": "value",
+                    "SUBMARINE": "not_a_group",
+                },
+                {"world": ["news"]},
+                id="ignores_non_sub_env_vars",
+            ),
+            pytest.param({"SUB_EMPTY": ""}, {}, id="empty_value_not_added"),
+            pytest.param(
+                {"SUB_WHITESPACE": "   ,   ,   "}, {}, id="whitespace_only_value_not_added"
+            ),
+            pytest.param(
+                {"SUB_MY_GROUP_NAME": "sub1,sub2"},
+                {"my_group_name": ["sub1", "sub2"]},
+                id="underscore_in_group_name",
+            ),
+            pytest.param(
+                {"SUB_GROUP123": "sub1,sub2"},
+                {"group123": ["sub1", "sub2"]},
+                id="numbers_in_group_name",
+            ),
+        ],
+    )
+    def test_parse_subreddit_groups(
+        self, env: dict[str, str], expected: dict[str, list[str]]
+    ) -> None:
         with patch.dict(os.environ, env, clear=True):
             groups = Config._parse_subreddit_groups()
 
-        assert "group123" in groups
+        assert groups == expected
 
 
 class TestConfigFromEnv:
     """Tests for Config.from_env() method."""
 
-    def test_missing_discord_token_raises(self) -> None:
-        env = {
-            "REDDIT_CLIENT_ID": "id",
-            "REDDIT_CLIENT_SECRET": "secret",
-            "ANTHROPIC_API_KEY": "key",
-        }
-
-        with patch.dict(os.environ, env, clear=True):
-            with pytest.raises(ValueError, match="DISCORD_TOKEN"):
-                Config.from_env()
-
-    def test_missing_reddit_client_id_raises(self) -> None:
-        env = {
-            "DISCORD_TOKEN": "token",
-            "REDDIT_CLIENT_SECRET": "secret",
-            "ANTHROPIC_API_KEY": "key",
-        }
-
-        with patch.dict(os.environ, env, clear=True):
-            with pytest.raises(ValueError, match="REDDIT_CLIENT_ID"):
-                Config.from_env()
-
-    def test_missing_reddit_client_secret_raises(self) -> None:
-        env = {
-            "DISCORD_TOKEN": "token",
-            "REDDIT_CLIENT_ID": "id",
-            "ANTHROPIC_API_KEY": "key",
-        }
-
-        with patch.dict(os.environ, env, clear=True):
-            with pytest.raises(ValueError, match="REDDIT_CLIENT_SECRET"):
-                Config.from_env()
-
-    def test_missing_anthropic_api_key_raises(self) -> None:
-        env = {
-            "DISCORD_TOKEN": "token",
-            "REDDIT_CLIENT_ID": "id",
-            "REDDIT_CLIENT_SECRET": "secret",
-        }
+    @pytest.mark.parametrize("missing_key", sorted(_REQUIRED_ENV))
+    def test_missing_required_key_raises(self, missing_key: str) -> None:
+        env = {k: v for k, v in _REQUIRED_ENV.items() if k != missing_key}
 
         with patch.dict(os.environ, env, clear=True):
-            with pytest.raises(ValueError, match="ANTHROPIC_API_KEY"):
+            with pytest.raises(ValueError, match=missing_key):
                 Config.from_env()
 
     def test_loads_required_config(self) -> None:
@@ -170,8 +138,7 @@ class TestConfigFromEnv:
             "SUB_TEST": "news,worldnews",
         }
 
-        with patch.dict(os.environ, env, clear=True):
-            config = Config.from_env()
+        config = make_config(env)
 
         assert config.discord_token == "my_discord_token"
         assert config.reddit_client_id == "my_client_id"
@@ -180,15 +147,7 @@ class TestConfigFromEnv:
         assert "test" in config.subreddit_groups
 
     def test_default_values(self) -> None:
-        env = {
-            "DISCORD_TOKEN": "token",
-            "REDDIT_CLIENT_ID": "id",
-            "REDDIT_CLIENT_SECRET": "secret",
-            "ANTHROPIC_API_KEY": "key",
-        }
-
-        with patch.dict(os.environ, env, clear=True):
-            config = Config.from_env()
+        config = make_config(dict(_REQUIRED_ENV))
 
         # Check defaults are set (actual values may vary by .env.example)
         assert config.reddit_user_agent.startswith("subtrends:")
@@ -200,10 +159,7 @@ class TestConfigFromEnv:
 
     def test_overrides_optional_config(self) -> None:
         env = {
-            "DISCORD_TOKEN": "token",
-            "REDDIT_CLIENT_ID": "id",
-            "REDDIT_CLIENT_SECRET": "secret",
-            "ANTHROPIC_API_KEY": "key",
+            **_REQUIRED_ENV,
             "REDDIT_USER_AGENT": "custom-agent:v2.0",
             "NUM_POSTS": "10",
             "NUM_COMMENTS": "15",
@@ -212,8 +168,7 @@ class TestConfigFromEnv:
             "DEFAULT_MODEL": "claude-sonnet-4-20250514",
         }
 
-        with patch.dict(os.environ, env, clear=True):
-            config = Config.from_env()
+        config = make_config(env)
 
         assert config.reddit_user_agent == "custom-agent:v2.0"
         assert config.num_posts == 10
@@ -1,21 +1,64 @@
 """Tests for news fetching service."""
 
-from unittest.mock import AsyncMock, MagicMock
+import inspect
+from collections.abc import Callable, Iterator
+from dataclasses import replace
+from typing import cast
 
 import pytest
 
 from src.models.reddit_types import Comment, Post
 from src.services.news_fetcher import NewsFetcher
 
+# Template cloned by tests instead of spelling out every field each time
+_POST_TEMPLATE = Post(title="Post", url="", score=100, subreddit="news", author="user")
 
-@pytest.fixture
-def mock_reddit_client() -> MagicMock:
-    client = MagicMock()
-    client.fetch_posts_with_comments = AsyncMock(return_value=[])
-    return client
 
+def make_post(**overrides: object) -> Post:
+    return replace(_POST_TEMPLATE, **overrides)  # type: ignore[arg-type]
 
-@pytest.fixture
+
+class StubRedditClient:
+    """Hand-rolled RedditClient stand-in.
+
+    Records fetch_posts_with_comments keyword arguments in ``calls`` and
+    serves ``side_effect`` (a plain or async callable) when set, otherwise
+    ``return_value``. Cheaper and more explicit than a MagicMock: a typo'd
+    attribute raises instead of silently auto-mocking.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, object]] = []
+        self.return_value: list[Post] = []
+        self.side_effect: Callable[..., object] | None = None
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.return_value = []
+        self.side_effect = None
+
+    async def fetch_posts_with_comments(
+        self, subreddit: str, num_posts: int, num_comments: int
+    ) -> list[Post]:
+        self.calls.append(
+            {"subreddit": subreddit, "num_posts": num_posts, "num_comments": num_comments}
+        )
+        if self.side_effect is not None:
+            result = self.side_effect(
+                subreddit=subreddit, num_posts=num_posts, num_comments=num_comments
+            )
+            if inspect.isawaitable(result):
+                result = await result
+            return result  # type: ignore[return-value]
+        return self.return_value
+
+
+@pytest.fixture(scope="class")
+def reddit_client() -> StubRedditClient:
+    return StubRedditClient()
+
+
+@pytest.fixture(scope="class")
 def subreddit_groups() -> dict[str, list[str]]:
     return {
         "world": ["news", "worldnews", "europe"],
@@ -23,30 +66,38 @@ def subreddit_groups() -> dict[str, list[str]]:
     }
 
 
-@pytest.fixture
-def fetcher(mock_reddit_client: MagicMock, subreddit_groups: dict[str, list[str]]) -> NewsFetcher:
+@pytest.fixture(scope="class")
+def fetcher(reddit_client: StubRedditClient, subreddit_groups: dict[str, list[str]]) -> NewsFetcher:
     return NewsFetcher(
-        reddit_client=mock_reddit_client,
+        reddit_client=reddit_client,  # type: ignore[arg-type]
         subreddit_groups=subreddit_groups,
         num_posts=5,
         num_comments=3,
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_state(reddit_client: StubRedditClient, fetcher: NewsFetcher) -> Iterator[None]:
+    """Restore the class-scoped stub and fetcher between tests."""
+    yield
+    reddit_client.reset()
+    fetcher._post_cache.clear()
+
+
 class TestNewsFetcherInit:
     """Tests for NewsFetcher initialization."""
 
     def test_initialization(
-        self, mock_reddit_client: MagicMock, subreddit_groups: dict[str, list[str]]
+        self, reddit_client: StubRedditClient, subreddit_groups: dict[str, list[str]]
     ) -> None:
         fetcher = NewsFetcher(
-            reddit_client=mock_reddit_client,
+            reddit_client=reddit_client,  # type: ignore[arg-type]
             subreddit_groups=subreddit_groups,
             num_posts=10,
             num_comments=5,
         )
 
-        assert fetcher.reddit_client is mock_reddit_client
+        assert cast(object, fetcher.reddit_client) is reddit_client
         assert fetcher.subreddit_groups == subreddit_groups
         assert fetcher.num_posts == 10
         assert fetcher.num_comments == 5
@@ -55,20 +106,21 @@ class TestNewsFetcherInit:
 class TestGetAvailableGroups:
     """Tests for get_available_groups method."""
 
-    def test_returns_copy_of_groups(self, fetcher: NewsFetcher) -> None:
+    def test_returns_read_only_view(self, fetcher: NewsFetcher) -> None:
         groups = fetcher.get_available_groups()
 
         assert groups == {
             "world": ["news", "worldnews", "europe"],
             "tech": ["programming", "webdev"],
         }
-        # Should be a copy, not the original
-        groups["world"] = ["modified"]
+        # A read-only view, not a mutable copy
+        with pytest.raises(TypeError):
+            groups["world"] = ["modified"]  # type: ignore[index]
         assert fetcher.subreddit_groups["world"] == ["news", "worldnews", "europe"]
 
-    def test_empty_groups(self, mock_reddit_client: MagicMock) -> None:
+    def test_empty_groups(self, reddit_client: StubRedditClient) -> None:
         fetcher = NewsFetcher(
-            reddit_client=mock_reddit_client,
+            reddit_client=reddit_client,  # type: ignore[arg-type]
             subreddit_groups={},
         )
 
@@ -81,20 +133,16 @@ class TestFetchGroup:
     """Tests for fetch_group method."""
 
     async def test_fetch_group_returns_subreddit_group(
-        self, fetcher: NewsFetcher, mock_reddit_client: MagicMock
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
     ) -> None:
-        mock_reddit_client.fetch_posts_with_comments.return_value = []
-
         result = await fetcher.fetch_group("world")
 
         assert result.name == "world"
         assert result.subreddits == ["news", "worldnews", "europe"]
 
     async def test_fetch_group_case_insensitive(
-        self, fetcher: NewsFetcher, mock_reddit_client: MagicMock
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
     ) -> None:
-        mock_reddit_client.fetch_posts_with_comments.return_value = []
-
         result = await fetcher.fetch_group("WORLD")
 
         assert result.name == "world"
@@ -104,46 +152,40 @@ class TestFetchGroup:
             await fetcher.fetch_group("nonexistent")
 
     async def test_fetch_group_calls_client_for_all_subreddits(
-        self, fetcher: NewsFetcher, mock_reddit_client: MagicMock
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
     ) -> None:
-        mock_reddit_client.fetch_posts_with_comments.return_value = []
-
         await fetcher.fetch_group("world")
 
-        assert mock_reddit_client.fetch_posts_with_comments.call_count == 3
-        call_args = [
-            call.kwargs["subreddit"]
-            for call in mock_reddit_client.fetch_posts_with_comments.call_args_list
-        ]
-        assert set(call_args) == {"news", "worldnews", "europe"}
+        assert len(reddit_client.calls) == 3
+        assert {call["subreddit"] for call in reddit_client.calls} == {
+            "news",
+            "worldnews",
+            "europe",
+        }
 
     async def test_fetch_group_passes_num_posts_and_comments(
-        self, fetcher: NewsFetcher, mock_reddit_client: MagicMock
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
     ) -> None:
-        mock_reddit_client.fetch_posts_with_comments.return_value = []
-
         await fetcher.fetch_group("tech")
 
-        call = mock_reddit_client.fetch_posts_with_comments.call_args_list[0]
-        assert call.kwargs["num_posts"] == 5
-        assert call.kwargs["num_comments"] == 3
+        call = reddit_client.calls[0]
+        assert call["num_posts"] == 5
+        assert call["num_comments"] == 3
 
     async def test_fetch_group_aggregates_posts(
-        self, fetcher: NewsFetcher, mock_reddit_client: MagicMock
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
     ) -> None:
         # Return different posts for different subreddits
         def mock_fetch(subreddit: str, **kwargs: int) -> list[Post]:
             return [
-                Post(
+                make_post(
                     title=f"Post from {subreddit}",
                     url=f"https://{subreddit}.example.com",
-                    score=100,
                     subreddit=subreddit,
-                    author="user",
                 )
             ]
 
-        mock_reddit_client.fetch_posts_with_comments.side_effect = mock_fetch
+        reddit_client.side_effect = mock_fetch
 
         result = await fetcher.fetch_group("world")
 
@@ -152,14 +194,13 @@ class TestFetchGroup:
         assert subreddits == {"news", "worldnews", "europe"}
 
     async def test_fetch_group_sorts_posts_by_score(
-        self, fetcher: NewsFetcher, mock_reddit_client: MagicMock
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
     ) -> None:
-        posts = [
-            Post(title="Low", url="", score=10, subreddit="news", author="user"),
-            Post(title="High", url="", score=1000, subreddit="news", author="user"),
-            Post(title="Medium", url="", score=100, subreddit="news", author="user"),
+        reddit_client.return_value = [
+            make_post(title="Low", score=10),
+            make_post(title="High", score=1000),
+            make_post(title="Medium", score=100),
         ]
-        mock_reddit_client.fetch_posts_with_comments.return_value = posts
 
         result = await fetcher.fetch_group("tech")
 
@@ -167,27 +208,15 @@ class TestFetchGroup:
         assert scores == sorted(scores, reverse=True)
 
     async def test_fetch_group_handles_client_exception(
-        self, fetcher: NewsFetcher, mock_reddit_client: MagicMock
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
     ) -> None:
         # One subreddit fails, others succeed
-        call_count = 0
-
         async def mock_fetch(subreddit: str, **kwargs: int) -> list[Post]:
-            nonlocal call_count
-            call_count += 1
             if subreddit == "worldnews":
                 raise Exception("Network error")
-            return [
-                Post(
-                    title=f"Post from {subreddit}",
-                    url="",
-                    score=100,
-                    subreddit=subreddit,
-                    author="user",
-                )
-            ]
+            return [make_post(title=f"Post from {subreddit}", subreddit=subreddit)]
 
-        mock_reddit_client.fetch_posts_with_comments.side_effect = mock_fetch
+        reddit_client.side_effect = mock_fetch
 
         result = await fetcher.fetch_group("world")
 
@@ -196,21 +225,48 @@ class TestFetchGroup:
         subreddits = {p.subreddit for p in result.posts}
         assert "worldnews" not in subreddits
 
-    async def test_fetch_group_includes_comments(
-        self, fetcher: NewsFetcher, mock_reddit_client: MagicMock
+    async def test_concurrent_fetches_share_one_crawl(
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
     ) -> None:
-        post_with_comments = Post(
-            title="Post with comments",
-            url="",
-            score=100,
-            subreddit="news",
-            author="user",
-            comments=[
-                Comment(body="Great post!", score=50, author="commenter1"),
-                Comment(body="Interesting", score=30, author="commenter2"),
-            ],
+        import asyncio
+
+        async def slow_fetch(subreddit: str, **kwargs: int) -> list[Post]:
+            await asyncio.sleep(0.01)
+            return []
+
+        reddit_client.side_effect = slow_fetch
+
+        first, second = await asyncio.gather(
+            fetcher.fetch_group("world"),
+            fetcher.fetch_group("world"),
         )
-        mock_reddit_client.fetch_posts_with_comments.return_value = [post_with_comments]
+
+        # Both callers get the same result from a single crawl: one call
+        # per subreddit, not one per subreddit per caller
+        assert first is second
+        assert len(reddit_client.calls) == 3
+
+    async def test_repeat_fetch_served_from_post_cache(
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
+    ) -> None:
+        await fetcher.fetch_group("world")
+        await fetcher.fetch_group("world")
+
+        # Second call within the TTL reuses cached per-subreddit results
+        assert len(reddit_client.calls) == 3
+
+    async def test_fetch_group_includes_comments(
+        self, fetcher: NewsFetcher, reddit_client: StubRedditClient
+    ) -> None:
+        reddit_client.return_value = [
+            make_post(
+                title="Post with comments",
+                comments=[
+                    Comment(body="Great post!", score=50, author="commenter1"),
+                    Comment(body="Interesting", score=30, author="commenter2"),
+                ],
+            )
+        ]
 
         result = await fetcher.fetch_group("tech")
 
@@ -1,11 +1,42 @@
 """Tests for rate limiting."""
 
 import asyncio
-import time
+from types import SimpleNamespace
 
+import pytest
+
+import src.services.rate_limiter as rate_limiter_module
 from src.services.rate_limiter import RateLimiter
 
 
+class VirtualClock:
+    """Fake monotonic clock so window-wait tests don't sleep for real."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> VirtualClock:
+    """Patch the limiter module onto a virtual clock (time and sleeps)."""
+    clock = VirtualClock()
+    monkeypatch.setattr(rate_limiter_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(
+        rate_limiter_module,
+        "asyncio",
+        SimpleNamespace(sleep=clock.sleep, Semaphore=asyncio.Semaphore, Lock=asyncio.Lock),
+    )
+    return clock
+
+
 class TestRateLimiter:
     """Tests for RateLimiter."""
 
@@ -49,11 +80,13 @@ class TestRateLimiter:
             async with limiter.acquire():
                 concurrent_count += 1
                 max_concurrent_observed = max(max_concurrent_observed, concurrent_count)
-                await asyncio.sleep(0.05)  # Simulate work
+                await asyncio.sleep(0.01)  # Simulate work
                 concurrent_count -= 1
 
         # Run 10 workers concurrently
-        await asyncio.gather(*[worker() for _ in range(10)])
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(10):
+                tg.create_task(worker())
 
         assert max_concurrent_observed <= 2
 
@@ -69,7 +102,7 @@ class TestRateLimiter:
         times = list(limiter.request_times)
         assert times == sorted(times)
 
-    async def test_request_times_deque_maxlen(self) -> None:
+    async def test_request_times_deque_maxlen(self, clock: VirtualClock) -> None:
         limiter = RateLimiter(max_concurrent=5, requests_per_minute=3)
 
         for _ in range(5):
@@ -78,44 +111,41 @@ class TestRateLimiter:
 
         # Deque should only keep last 3 (requests_per_minute)
         assert len(limiter.request_times) == 3
+        # The over-quota acquisitions waited out the window on the fake clock
+        assert clock.sleeps == [pytest.approx(60.0)]
 
-    async def test_rate_limit_waits_when_exceeded(self) -> None:
-        # Use very small window for faster test
+    async def test_rate_limit_waits_when_exceeded(self, clock: VirtualClock) -> None:
         limiter = RateLimiter(max_concurrent=10, requests_per_minute=3)
 
-        # Fill up the rate limit quickly
+        # Fill up the rate limit at t=0
         for _ in range(3):
             async with limiter.acquire():
                 pass
 
-        # Manually set old request times to simulate time passing
-        # Set oldest request to 59 seconds ago (should trigger 1 second wait)
-        old_time = time.monotonic() - 59
-        limiter.request_times.clear()
-        for _ in range(3):
-            limiter.request_times.append(old_time)
-
-        start = time.monotonic()
+        # 59 seconds later the oldest slot is 1 second from expiring,
+        # so the next acquire should wait out exactly that second
+        clock.now = 59.0
         async with limiter.acquire():
             pass
-        elapsed = time.monotonic() - start
 
-        # Should have waited approximately 1 second
-        assert elapsed >= 0.9
+        assert clock.sleeps == [pytest.approx(1.0)]
+        assert clock.now == pytest.approx(60.0)
 
     async def test_concurrent_acquire_thread_safe(self) -> None:
         limiter = RateLimiter(max_concurrent=3, requests_per_minute=100)
-        results: list[int] = []
+        results: list[int | None] = [None] * 20
 
         async def worker(task_id: int) -> None:
             async with limiter.acquire():
-                results.append(task_id)
+                results[task_id] = task_id
                 await asyncio.sleep(0.01)
 
         # Run many concurrent workers
-        await asyncio.gather(*[worker(i) for i in range(20)])
+        async with asyncio.TaskGroup() as tg:
+            for i in range(20):
+                tg.create_task(worker(i))
 
         # All workers should complete
-        assert len(results) == 20
+        assert all(r is not None for r in results)
         # Request times should be tracked (up to max)
         assert len(limiter.request_times) <= limiter.requests_per_minute
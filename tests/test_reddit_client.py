@@ -1,11 +1,13 @@
 """Tests for Reddit API client."""
 
+import asyncio
 import re
+import time
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
 
 import httpx
+import orjson
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -16,16 +18,31 @@ from src.clients.reddit import (
 )
 from src.clients.token_cache import TokenCache
 from src.models.reddit_types import Post
-from src.services.rate_limiter import RateLimiter
 
+# URL patterns compiled once for the whole module instead of per test
+_ESC_BASE = re.escape(REDDIT_API_BASE)
+TOP_POSTS_RE = re.compile(rf"{_ESC_BASE}/r/[^/]+/top.*")
+COMMENTS_RE = re.compile(rf"{_ESC_BASE}/r/[^/]+/comments/.*")
 
-@pytest.fixture
-def mock_rate_limiter() -> MagicMock:
-    limiter = MagicMock(spec=RateLimiter)
-    # Create an async context manager mock
-    limiter.acquire.return_value.__aenter__ = AsyncMock()
-    limiter.acquire.return_value.__aexit__ = AsyncMock()
-    return limiter
+
+class _NullRateLimiter:
+    """Pass-through stand-in for RateLimiter's async context manager."""
+
+    def acquire(self) -> "_NullRateLimiter":
+        return self
+
+    async def __aenter__(self) -> "_NullRateLimiter":
+        return self
+
+    async def __aexit__(self, *args: object) -> bool:
+        return False
+
+
+# Session-scoped: the stub is stateless pass-through and nothing asserts
+# on its call history, so one instance serves every test
+@pytest.fixture(scope="session")
+def mock_rate_limiter() -> _NullRateLimiter:
+    return _NullRateLimiter()
 
 
 @pytest.fixture
@@ -34,16 +51,37 @@ def mock_token_cache(tmp_path: Path) -> TokenCache:
 
 
 @pytest.fixture
-def client(mock_rate_limiter: MagicMock, mock_token_cache: TokenCache) -> RedditClient:
+def client(mock_rate_limiter: _NullRateLimiter, mock_token_cache: TokenCache) -> RedditClient:
     return RedditClient(
         client_id="test_client_id",
         client_secret="test_client_secret",
         user_agent="test-agent:v1.0",
-        rate_limiter=mock_rate_limiter,
+        rate_limiter=mock_rate_limiter,  # type: ignore[arg-type]
         token_cache=mock_token_cache,
     )
 
 
+# A valid token file written once per session; tests that only need "some
+# valid token" read it instead of each awaiting an async cache write
+@pytest.fixture(scope="session")
+def warm_token_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("token_cache") / ".token_cache.json"
+    payload = {"access_token": "test_token", "expires_at": time.time() + 3600}
+    path.write_bytes(orjson.dumps(payload))
+    return path
+
+
+@pytest.fixture
+def warm_client(mock_rate_limiter: _NullRateLimiter, warm_token_path: Path) -> RedditClient:
+    return RedditClient(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        user_agent="test-agent:v1.0",
+        rate_limiter=mock_rate_limiter,  # type: ignore[arg-type]
+        token_cache=TokenCache(path=str(warm_token_path)),
+    )
+
+
 def make_oauth_response() -> dict:
     """Create a mock OAuth token response."""
     return {
@@ -63,6 +101,20 @@ def make_post_listing(posts: list[dict]) -> dict:
     }
 
 
+# Shared builder defaults: the static fields live in one template dict and
+# "now" is sampled once at import — well inside any freshness window the
+# client checks, and N tests skip N clock reads and dict literals
+_FIXED_NOW = datetime.now(tz=UTC).timestamp()
+
+_POST_TEMPLATE = {
+    "author": "testuser",
+    "selftext": "",
+    "num_comments": 5,
+}
+
+_COMMENT_TEMPLATE = {"author": "commenter"}
+
+
 def make_post_data(
     title: str = "Test Post",
     subreddit: str = "test",
@@ -71,18 +123,14 @@ def make_post_data(
     created_utc: float | None = None,
 ) -> dict:
     """Create mock post data."""
-    if created_utc is None:
-        created_utc = datetime.now(tz=UTC).timestamp()
     return {
+        **_POST_TEMPLATE,
         "title": title,
         "subreddit": subreddit,
         "score": score,
         "url": url,
-        "author": "testuser",
-        "selftext": "",
-        "num_comments": 5,
         "permalink": f"/r/{subreddit}/comments/abc123/{title.lower().replace(' ', '_')}/",
-        "created_utc": created_utc,
+        "created_utc": _FIXED_NOW if created_utc is None else created_utc,
     }
 
 
@@ -99,11 +147,7 @@ def make_comments_response(post_data: dict, comments: list[dict]) -> list:
 
 def make_comment_data(body: str = "Test comment", score: int = 10) -> dict:
     """Create mock comment data."""
-    return {
-        "body": body,
-        "score": score,
-        "author": "commenter",
-    }
+    return {**_COMMENT_TEMPLATE, "body": body, "score": score}
 
 
 class TestRedditClientInit:
@@ -120,7 +164,8 @@ class TestRedditClientInit:
         assert client.client_secret == "my_secret"
         assert client.user_agent == "my-agent:v1.0"
 
-    def test_creates_default_rate_limiter(self) -> None:
+    def test_initialization_defaults(self) -> None:
+        # One construction covers both default collaborators
         client = RedditClient(
             client_id="id",
             client_secret="secret",
@@ -128,14 +173,6 @@ class TestRedditClientInit:
         )
 
         assert client.rate_limiter is not None
-
-    def test_creates_default_token_cache(self) -> None:
-        client = RedditClient(
-            client_id="id",
-            client_secret="secret",
-            user_agent="agent",
-        )
-
         assert client.token_cache is not None
 
 
@@ -155,80 +192,85 @@ class TestRedditClientContextManager:
 class TestFetchTopPosts:
     """Tests for fetch_top_posts method."""
 
-    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_fetch_top_posts_success(
         self,
-        client: RedditClient,
-        mock_token_cache: TokenCache,
+        warm_client: RedditClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        # Setup token
-        await mock_token_cache.set("test_token", 3600)
-
         # Mock posts request (use url pattern to match query params)
         post_data = make_post_data(title="Test Post", score=100)
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/top.*"),
+            url=TOP_POSTS_RE,
             method="GET",
             json=make_post_listing([post_data]),
         )
 
-        async with client:
-            posts = await client.fetch_top_posts("test", limit=10)
+        async with warm_client:
+            posts = await warm_client.fetch_top_posts("test", limit=10)
 
         assert len(posts) == 1
         assert posts[0].title == "Test Post"
         assert posts[0].score == 100
 
-    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_fetch_top_posts_filters_old_posts(
         self,
-        client: RedditClient,
-        mock_token_cache: TokenCache,
+        warm_client: RedditClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        await mock_token_cache.set("test_token", 3600)
-
         # One recent post, one old post
-        recent_post = make_post_data(
-            title="Recent",
-            created_utc=datetime.now(tz=UTC).timestamp(),
-        )
+        recent_post = make_post_data(title="Recent", created_utc=_FIXED_NOW)
         old_post = make_post_data(
             title="Old",
-            created_utc=datetime.now(tz=UTC).timestamp() - 100000,  # More than 24h ago
+            created_utc=_FIXED_NOW - 100000,  # More than 24h ago
         )
 
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/top.*"),
+            url=TOP_POSTS_RE,
             method="GET",
             json=make_post_listing([recent_post, old_post]),
         )
 
-        async with client:
-            posts = await client.fetch_top_posts("test")
+        async with warm_client:
+            posts = await warm_client.fetch_top_posts("test", time_filter="week")
 
         assert len(posts) == 1
         assert posts[0].title == "Recent"
 
+    async def test_fetch_top_posts_trusts_day_window(
+        self,
+        warm_client: RedditClient,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        # With time_filter="day" Reddit enforces the window server-side,
+        # so the client keeps everything it returns
+        old_post = make_post_data(title="Old", created_utc=_FIXED_NOW - 100000)
+
+        httpx_mock.add_response(
+            url=TOP_POSTS_RE,
+            method="GET",
+            json=make_post_listing([old_post]),
+        )
+
+        async with warm_client:
+            posts = await warm_client.fetch_top_posts("test")
+
+        assert len(posts) == 1
+
     @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_fetch_top_posts_handles_error(
         self,
-        client: RedditClient,
-        mock_token_cache: TokenCache,
+        warm_client: RedditClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        await mock_token_cache.set("test_token", 3600)
-
         # Return error for posts (match any method since retries might happen)
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/private/top.*"),
+            url=TOP_POSTS_RE,
             method="GET",
             status_code=403,
         )
 
-        async with client:
-            posts = await client.fetch_top_posts("private")
+        async with warm_client:
+            posts = await warm_client.fetch_top_posts("private")
 
         # Should return empty list on error
         assert posts == []
@@ -237,15 +279,11 @@ class TestFetchTopPosts:
 class TestFetchPostComments:
     """Tests for fetch_post_comments method."""
 
-    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_fetch_comments_success(
         self,
-        client: RedditClient,
-        mock_token_cache: TokenCache,
+        warm_client: RedditClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        await mock_token_cache.set("test_token", 3600)
-
         post_data = make_post_data()
         comments = [
             make_comment_data(body="First comment", score=50),
@@ -253,7 +291,7 @@ class TestFetchPostComments:
         ]
 
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/comments/.*"),
+            url=COMMENTS_RE,
             method="GET",
             json=make_comments_response(post_data, comments),
         )
@@ -267,22 +305,18 @@ class TestFetchPostComments:
             permalink="/r/test/comments/abc123/test/",
         )
 
-        async with client:
-            fetched_comments = await client.fetch_post_comments(post, limit=5)
+        async with warm_client:
+            fetched_comments = await warm_client.fetch_post_comments(post, limit=5)
 
         assert len(fetched_comments) == 2
         assert fetched_comments[0].body == "First comment"
         assert fetched_comments[1].body == "Second comment"
 
-    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_fetch_comments_skips_deleted(
         self,
-        client: RedditClient,
-        mock_token_cache: TokenCache,
+        warm_client: RedditClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        await mock_token_cache.set("test_token", 3600)
-
         post_data = make_post_data()
         comments = [
             make_comment_data(body="Valid comment"),
@@ -292,7 +326,7 @@ class TestFetchPostComments:
         ]
 
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/comments/.*"),
+            url=COMMENTS_RE,
             method="GET",
             json=make_comments_response(post_data, comments),
         )
@@ -306,8 +340,8 @@ class TestFetchPostComments:
             permalink="/r/test/comments/abc/test/",
         )
 
-        async with client:
-            fetched_comments = await client.fetch_post_comments(post)
+        async with warm_client:
+            fetched_comments = await warm_client.fetch_post_comments(post)
 
         assert len(fetched_comments) == 1
         assert fetched_comments[0].body == "Valid comment"
@@ -325,8 +359,9 @@ class TestFetchPostComments:
             permalink="",  # No permalink
         )
 
-        async with client:
-            comments = await client.fetch_post_comments(post)
+        # Early return happens before any HTTP client is needed, so no
+        # async with client: lifecycle is required
+        comments = await client.fetch_post_comments(post)
 
         assert comments == []
 
@@ -334,7 +369,6 @@ class TestFetchPostComments:
 class TestOAuthToken:
     """Tests for OAuth token handling."""
 
-    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_fetches_new_token_when_missing(
         self,
         client: RedditClient,
@@ -347,7 +381,7 @@ class TestOAuthToken:
         )
 
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/top.*"),
+            url=TOP_POSTS_RE,
             method="GET",
             json=make_post_listing([make_post_data()]),
         )
@@ -360,30 +394,75 @@ class TestOAuthToken:
         auth_requests = [r for r in requests if "access_token" in str(r.url)]
         assert len(auth_requests) == 1
 
-    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_reuses_cached_token(
         self,
-        client: RedditClient,
-        mock_token_cache: TokenCache,
+        warm_client: RedditClient,
         httpx_mock: HTTPXMock,
     ) -> None:
         # Pre-set a valid token
-        await mock_token_cache.set("cached_token", 3600)
-
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/top.*"),
+            url=TOP_POSTS_RE,
             method="GET",
             json=make_post_listing([make_post_data()]),
         )
 
-        async with client:
-            await client.fetch_top_posts("test")
+        async with warm_client:
+            await warm_client.fetch_top_posts("test")
 
         # Should NOT have made OAuth request
         requests = httpx_mock.get_requests()
         auth_requests = [r for r in requests if "access_token" in str(r.url)]
         assert len(auth_requests) == 0
 
+    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+    async def test_concurrent_requests_share_one_refresh(
+        self,
+        client: RedditClient,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        httpx_mock.add_response(
+            url=REDDIT_AUTH_URL,
+            method="POST",
+            json=make_oauth_response(),
+        )
+
+        httpx_mock.add_response(
+            url=TOP_POSTS_RE,
+            method="GET",
+            json=make_post_listing([make_post_data()]),
+        )
+
+        async with client:
+            await asyncio.gather(
+                client.fetch_top_posts("test"),
+                client.fetch_top_posts("other"),
+            )
+
+        # Both concurrent fetches should share a single OAuth refresh
+        requests = httpx_mock.get_requests()
+        auth_requests = [r for r in requests if "access_token" in str(r.url)]
+        assert len(auth_requests) == 1
+
+    async def test_rejected_credentials_not_retried(
+        self,
+        client: RedditClient,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        httpx_mock.add_response(
+            url=REDDIT_AUTH_URL,
+            method="POST",
+            status_code=401,
+        )
+
+        async with client:
+            posts = await client.fetch_top_posts("test")
+
+        # Credential rejection should fail fast (no retries) and yield no posts
+        assert posts == []
+        requests = httpx_mock.get_requests()
+        auth_requests = [r for r in requests if "access_token" in str(r.url)]
+        assert len(auth_requests) == 1
+
 
 class TestRateLimitHandling:
     """Tests for rate limit handling."""
@@ -391,12 +470,9 @@ class TestRateLimitHandling:
     @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_retries_on_rate_limit(
         self,
-        client: RedditClient,
-        mock_token_cache: TokenCache,
+        warm_client: RedditClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        await mock_token_cache.set("test_token", 3600)
-
         # First request returns 429, then succeeds
         call_count = [0]
 
@@ -414,12 +490,12 @@ class TestRateLimitHandling:
 
         httpx_mock.add_callback(
             response_callback,
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/top.*"),
+            url=TOP_POSTS_RE,
             method="GET",
         )
 
-        async with client:
-            posts = await client.fetch_top_posts("test")
+        async with warm_client:
+            posts = await warm_client.fetch_top_posts("test")
 
         assert len(posts) == 1
 
@@ -427,18 +503,14 @@ class TestRateLimitHandling:
 class TestFetchPostsWithComments:
     """Tests for fetch_posts_with_comments method."""
 
-    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
     async def test_fetches_posts_and_comments(
         self,
-        client: RedditClient,
-        mock_token_cache: TokenCache,
+        warm_client: RedditClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        await mock_token_cache.set("test_token", 3600)
-
         post_data = make_post_data(title="Test Post")
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/top.*"),
+            url=TOP_POSTS_RE,
             method="GET",
             json=make_post_listing([post_data]),
         )
@@ -446,15 +518,51 @@ class TestFetchPostsWithComments:
         # Comments endpoint
         comments = [make_comment_data(body="A comment")]
         httpx_mock.add_response(
-            url=re.compile(rf"{re.escape(REDDIT_API_BASE)}/r/test/comments/.*"),
+            url=COMMENTS_RE,
             method="GET",
             json=make_comments_response(post_data, comments),
         )
 
-        async with client:
-            posts = await client.fetch_posts_with_comments("test", num_posts=5, num_comments=3)
+        async with warm_client:
+            posts = await warm_client.fetch_posts_with_comments("test", num_posts=5, num_comments=3)
 
         assert len(posts) == 1
         assert posts[0].title == "Test Post"
         assert len(posts[0].comments) == 1
         assert posts[0].comments[0].body == "A comment"
+
+    @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+    async def test_fetches_comments_concurrently(
+        self,
+        warm_client: RedditClient,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        post_listing = make_post_listing([make_post_data(title=f"Post {i}") for i in range(10)])
+        httpx_mock.add_response(url=TOP_POSTS_RE, method="GET", json=post_listing)
+
+        in_flight = 0
+        max_overlap = 0
+
+        async def comments_callback(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_overlap
+            in_flight += 1
+            max_overlap = max(max_overlap, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(
+                status_code=200,
+                json=make_comments_response(make_post_data(), []),
+            )
+
+        httpx_mock.add_callback(comments_callback, url=COMMENTS_RE, method="GET")
+
+        async with warm_client:
+            posts = await warm_client.fetch_posts_with_comments(
+                "test", num_posts=10, num_comments=3
+            )
+
+        assert len(posts) == 10
+        # Comment fetches must overlap (gather), but stay inside the
+        # max_concurrency bound — a serial loop would never exceed 1
+        assert max_overlap > 1
+        assert max_overlap <= 5
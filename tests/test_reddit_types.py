@@ -1,5 +1,9 @@
 """Tests for Reddit data types."""
 
+from typing import Any
+
+import pytest
+
 from src.models.reddit_types import Comment, Post, SubredditGroup
 
 
@@ -28,44 +32,86 @@ class TestComment:
 class TestPost:
     """Tests for Post dataclass."""
 
-    def test_post_creation_minimal(self) -> None:
-        post = Post(
-            title="Test Post",
-            url="https://example.com",
-            score=100,
-            subreddit="test",
-            author="testuser",
-        )
-
-        assert post.title == "Test Post"
-        assert post.url == "https://example.com"
-        assert post.score == 100
-        assert post.subreddit == "test"
-        assert post.author == "testuser"
-        assert post.selftext == ""
-        assert post.num_comments == 0
-        assert post.permalink == ""
-        assert post.comments == []
-
-    def test_post_creation_full(self) -> None:
-        comment = Comment(body="Nice post!", score=5, author="commenter")
-        post = Post(
-            title="Full Post",
-            url="https://example.com/article",
-            score=500,
-            subreddit="news",
-            author="poster",
-            selftext="This is the post content",
-            num_comments=10,
-            permalink="/r/news/comments/abc123/full_post/",
-            comments=[comment],
-        )
-
-        assert post.selftext == "This is the post content"
-        assert post.num_comments == 10
-        assert post.permalink == "/r/news/comments/abc123/full_post/"
-        assert len(post.comments) == 1
-        assert post.comments[0].body == "Nice post!"
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param(
+                {
+                    "title": "Test Post",
+                    "url": "https://example.com",
+                    "score": 100,
+                    "subreddit": "test",
+                    "author": "testuser",
+                },
+                {
+                    "title": "Test Post",
+                    "url": "https://example.com",
+                    "score": 100,
+                    "subreddit": "test",
+                    "author": "testuser",
+                    "selftext": "",
+                    "num_comments": 0,
+                    "permalink": "",
+                    "comments": [],
+                },
+                id="minimal",
+            ),
+            pytest.param(
+                {
+                    "title": "Full Post",
+                    "url": "https://example.com/article",
+                    "score": 500,
+                    "subreddit": "news",
+                    "author": "poster",
+                    "selftext": "This is the post content",
+                    "num_comments": 10,
+                    "permalink": "/r/news/comments/abc123/full_post/",
+                    "comments": [Comment(body="Nice post!", score=5, author="commenter")],
+                },
+                {
+                    "selftext": "This is the post content",
+                    "num_comments": 10,
+                    "permalink": "/r/news/comments/abc123/full_post/",
+                    "comments": [Comment(body="Nice post!", score=5, author="commenter")],
+                },
+                id="full",
+            ),
+            pytest.param(
+                {
+                    "title": "Test",
+                    "url": "https://external.com/link",
+                    "score": 1,
+                    "subreddit": "test",
+                    "author": "user",
+                    "permalink": "/r/test/comments/xyz789/test/",
+                },
+                {
+                    "full_url": "https://reddit.com/r/test/comments/xyz789/test/",
+                    "comments_endpoint": "/r/test/comments/xyz789/test.json",
+                },
+                id="derived_fields_with_permalink",
+            ),
+            pytest.param(
+                {
+                    "title": "Test",
+                    "url": "https://external.com/link",
+                    "score": 1,
+                    "subreddit": "test",
+                    "author": "user",
+                },
+                {
+                    "full_url": "https://external.com/link",
+                    "comments_endpoint": "",
+                },
+                id="derived_fields_without_permalink",
+            ),
+        ],
+    )
+    def test_post_attributes(self, kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+        post = Post(**kwargs)
+
+        for attr, value in expected.items():
+            assert getattr(post, attr) == value
 
     def test_post_str(self) -> None:
         post = Post(
@@ -82,29 +128,6 @@ class TestPost:
         assert "r/python" in result
         assert "My Title" in result
 
-    def test_full_url_with_permalink(self) -> None:
-        post = Post(
-            title="Test",
-            url="https://external.com/link",
-            score=1,
-            subreddit="test",
-            author="user",
-            permalink="/r/test/comments/xyz789/test/",
-        )
-
-        assert post.full_url == "https://reddit.com/r/test/comments/xyz789/test/"
-
-    def test_full_url_without_permalink(self) -> None:
-        post = Post(
-            title="Test",
-            url="https://external.com/link",
-            score=1,
-            subreddit="test",
-            author="user",
-        )
-
-        assert post.full_url == "https://external.com/link"
-
 
 class TestSubredditGroup:
     """Tests for SubredditGroup dataclass."""
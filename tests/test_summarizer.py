@@ -1,5 +1,6 @@
 """Tests for summarization service."""
 
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -20,7 +21,8 @@ def summarizer(mock_anthropic_client: MagicMock) -> Summarizer:
     return Summarizer(client=mock_anthropic_client)
 
 
-@pytest.fixture
+# Module-scoped: tests only read the posts, never mutate them
+@pytest.fixture(scope="module")
 def sample_posts() -> list[Post]:
     return [
         Post(
@@ -50,98 +52,119 @@ def sample_posts() -> list[Post]:
     ]
 
 
+# One shared summarize() call whose captured kwargs feed the parametrized
+# prompt-content assertions below, instead of re-running the same code
+# path once per asserted substring
+@pytest.fixture(scope="module")
+async def summarize_call_kwargs(sample_posts: list[Post]) -> dict[str, Any]:
+    client = MagicMock()
+    client.generate = AsyncMock(return_value="Mock response")
+    await Summarizer(client=client).summarize("world", sample_posts)
+
+    client.generate.assert_called_once()
+    kwargs: dict[str, Any] = client.generate.call_args.kwargs
+    return kwargs
+
+
 class TestSummarizer:
     """Tests for Summarizer class."""
 
     async def test_summarize_calls_client_with_prompt(
-        self,
-        summarizer: Summarizer,
-        mock_anthropic_client: MagicMock,
-        sample_posts: list[Post],
+        self, summarize_call_kwargs: dict[str, Any]
     ) -> None:
-        await summarizer.summarize("world", sample_posts)
-
-        mock_anthropic_client.generate.assert_called_once()
-        call_kwargs = mock_anthropic_client.generate.call_args.kwargs
-        assert "prompt" in call_kwargs
-        assert "system" in call_kwargs
-        assert "WORLD" in call_kwargs["prompt"]
+        assert "prompt" in summarize_call_kwargs
+        assert "system" in summarize_call_kwargs
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "WORLD",
+            "Breaking News: Major Event",
+            "Technology Update",
+            "r/news",
+            "r/technology",
+            "This is huge!",
+            "Interesting development",
+            "This is the content of the news post.",
+        ],
+    )
+    async def test_summarize_prompt_contents(
+        self, summarize_call_kwargs: dict[str, Any], needle: str
+    ) -> None:
+        assert needle in summarize_call_kwargs["prompt"]
 
-    async def test_summarize_includes_post_content(
+    async def test_summarize_passes_model(
         self,
         summarizer: Summarizer,
         mock_anthropic_client: MagicMock,
         sample_posts: list[Post],
     ) -> None:
-        await summarizer.summarize("world", sample_posts)
+        await summarizer.summarize("world", sample_posts, model="claude-sonnet-4-20250514")
 
         call_kwargs = mock_anthropic_client.generate.call_args.kwargs
-        prompt = call_kwargs["prompt"]
-
-        assert "Breaking News: Major Event" in prompt
-        assert "Technology Update" in prompt
-        assert "r/news" in prompt
-        assert "r/technology" in prompt
+        assert call_kwargs["model"] == "claude-sonnet-4-20250514"
 
-    async def test_summarize_includes_comments(
+    async def test_summarize_returns_response(
         self,
         summarizer: Summarizer,
         mock_anthropic_client: MagicMock,
         sample_posts: list[Post],
     ) -> None:
-        await summarizer.summarize("world", sample_posts)
+        mock_anthropic_client.generate.return_value = "Summary of the news"
 
-        call_kwargs = mock_anthropic_client.generate.call_args.kwargs
-        prompt = call_kwargs["prompt"]
+        result = await summarizer.summarize("world", sample_posts)
 
-        assert "This is huge!" in prompt
-        assert "Interesting development" in prompt
+        assert result == "Summary of the news"
 
-    async def test_summarize_includes_selftext(
+    async def test_summarize_empty_posts(
         self,
         summarizer: Summarizer,
         mock_anthropic_client: MagicMock,
-        sample_posts: list[Post],
     ) -> None:
-        await summarizer.summarize("world", sample_posts)
+        result = await summarizer.summarize("world", [])
 
-        call_kwargs = mock_anthropic_client.generate.call_args.kwargs
-        prompt = call_kwargs["prompt"]
+        assert "Не знайдено постів" in result
+        mock_anthropic_client.generate.assert_not_called()
 
-        assert "This is the content of the news post." in prompt
 
-    async def test_summarize_passes_model(
+class TestSummaryCache:
+    """Tests for the summary TTL cache."""
+
+    async def test_identical_request_served_from_cache(
         self,
         summarizer: Summarizer,
         mock_anthropic_client: MagicMock,
         sample_posts: list[Post],
     ) -> None:
-        await summarizer.summarize("world", sample_posts, model="claude-sonnet-4-20250514")
+        mock_anthropic_client.generate.return_value = "Cached summary"
 
-        call_kwargs = mock_anthropic_client.generate.call_args.kwargs
-        assert call_kwargs["model"] == "claude-sonnet-4-20250514"
+        first = await summarizer.summarize("world", sample_posts)
+        second = await summarizer.summarize("world", sample_posts)
 
-    async def test_summarize_returns_response(
+        assert first == second == "Cached summary"
+        mock_anthropic_client.generate.assert_called_once()
+
+    async def test_different_model_bypasses_cache(
         self,
         summarizer: Summarizer,
         mock_anthropic_client: MagicMock,
         sample_posts: list[Post],
     ) -> None:
-        mock_anthropic_client.generate.return_value = "Summary of the news"
-
-        result = await summarizer.summarize("world", sample_posts)
+        await summarizer.summarize("world", sample_posts, model="model-a")
+        await summarizer.summarize("world", sample_posts, model="model-b")
 
-        assert result == "Summary of the news"
+        assert mock_anthropic_client.generate.call_count == 2
 
-    async def test_summarize_empty_posts(
+    async def test_different_posts_bypass_cache(
         self,
         summarizer: Summarizer,
         mock_anthropic_client: MagicMock,
+        sample_posts: list[Post],
     ) -> None:
-        result = await summarizer.summarize("world", [])
+        await summarizer.summarize("world", sample_posts)
+        await summarizer.summarize("world", sample_posts[:1])
 
-        assert "Не знайдено постів" in result
-        mock_anthropic_client.generate.assert_not_called()
+        assert mock_anthropic_client.generate.call_count == 2
 
 
 class TestTranslateToUkrainian:
@@ -194,12 +217,24 @@ class TestTranslateToUkrainian:
 class TestSummarizeAndTranslate:
     """Tests for summarize_and_translate method."""
 
-    async def test_calls_both_summarize_and_translate(
+    async def test_single_api_call_by_default(
         self,
         summarizer: Summarizer,
         mock_anthropic_client: MagicMock,
         sample_posts: list[Post],
     ) -> None:
+        mock_anthropic_client.generate.return_value = "Переклад"
+
+        await summarizer.summarize_and_translate("world", sample_posts)
+
+        mock_anthropic_client.generate.assert_called_once()
+
+    async def test_two_step_calls_summarize_then_translate(
+        self,
+        mock_anthropic_client: MagicMock,
+        sample_posts: list[Post],
+    ) -> None:
+        summarizer = Summarizer(client=mock_anthropic_client, two_step=True)
         mock_anthropic_client.generate.side_effect = ["Summary", "Переклад"]
 
         await summarizer.summarize_and_translate("world", sample_posts)
@@ -212,7 +247,7 @@ class TestSummarizeAndTranslate:
         mock_anthropic_client: MagicMock,
         sample_posts: list[Post],
     ) -> None:
-        mock_anthropic_client.generate.side_effect = ["Summary", "Переклад"]
+        mock_anthropic_client.generate.return_value = "Переклад"
 
         result = await summarizer.summarize_and_translate("world", sample_posts)
 
@@ -236,7 +271,7 @@ class TestSummarizeAndTranslate:
                 permalink="/r/test/comments/abc/long/",
             )
         ]
-        mock_anthropic_client.generate.side_effect = ["Summary", "Translation"]
+        mock_anthropic_client.generate.return_value = "Translation"
 
         result = await summarizer.summarize_and_translate("test", posts)
 
@@ -244,13 +279,13 @@ class TestSummarizeAndTranslate:
         assert "..." in result
         assert long_title not in result
 
-    async def test_passes_model_to_both_calls(
+    async def test_passes_model_to_all_calls(
         self,
         summarizer: Summarizer,
         mock_anthropic_client: MagicMock,
         sample_posts: list[Post],
     ) -> None:
-        mock_anthropic_client.generate.side_effect = ["Summary", "Translation"]
+        mock_anthropic_client.generate.return_value = "Translation"
 
         await summarizer.summarize_and_translate("world", sample_posts, model="test-model")
 
@@ -295,20 +330,22 @@ class TestBuildSummaryPrompt:
         assert long_comment not in prompt
 
     def test_truncates_overall_content(self, summarizer: Summarizer) -> None:
-        # Create many posts to exceed MAX_CONTENT_LENGTH
+        # Exceed MAX_CONTENT_LENGTH with the fewest allocations possible:
+        # selftext and comments are clipped per post, so share one maxed-out
+        # string and one comment list across just enough posts to overflow
+        selftext = "x" * 1000
+        comments = [Comment(body="y" * 500, score=10, author="user")] * 5
         posts = [
             Post(
-                title=f"Post {i} with a longer title to take up space",
+                title=f"Post {i}",
                 url="",
                 score=100,
                 subreddit="test",
                 author="user",
-                selftext="Some content " * 100,
-                comments=[
-                    Comment(body="Comment " * 50, score=10, author=f"user{j}") for j in range(5)
-                ],
+                selftext=selftext,
+                comments=comments,
             )
-            for i in range(100)
+            for i in range(35)
         ]
 
         prompt = summarizer._build_summary_prompt("test", posts)
@@ -18,41 +18,19 @@ class TestCachedToken:
         assert token.access_token == "test_token"
         assert token.expires_at > time.time()
 
-    def test_is_valid_with_future_expiry(self) -> None:
-        # Token expires in 1 hour (well beyond the buffer)
-        token = CachedToken(
-            access_token="test_token",
-            expires_at=time.time() + 3600,
-        )
-
-        assert token.is_valid() is True
-
-    def test_is_valid_with_past_expiry(self) -> None:
-        # Token already expired
-        token = CachedToken(
-            access_token="test_token",
-            expires_at=time.time() - 100,
-        )
-
-        assert token.is_valid() is False
-
-    def test_is_valid_within_buffer_is_invalid(self) -> None:
-        # Token expires within buffer time (5 minutes)
-        token = CachedToken(
-            access_token="test_token",
-            expires_at=time.time() + TOKEN_EXPIRY_BUFFER - 10,
-        )
+    @pytest.mark.parametrize(
+        ("offset", "expected"),
+        [
+            pytest.param(3600, True, id="future_expiry"),
+            pytest.param(-100, False, id="past_expiry"),
+            pytest.param(TOKEN_EXPIRY_BUFFER - 10, False, id="within_buffer"),
+            pytest.param(TOKEN_EXPIRY_BUFFER + 10, True, id="just_beyond_buffer"),
+        ],
+    )
+    def test_is_valid(self, offset: float, expected: bool) -> None:
+        token = CachedToken(access_token="test_token", expires_at=time.time() + offset)
 
-        assert token.is_valid() is False
-
-    def test_is_valid_just_beyond_buffer(self) -> None:
-        # Token expires just beyond the buffer
-        token = CachedToken(
-            access_token="test_token",
-            expires_at=time.time() + TOKEN_EXPIRY_BUFFER + 10,
-        )
-
-        assert token.is_valid() is True
+        assert token.is_valid() is expected
 
 
 class TestTokenCache:
@@ -159,6 +137,47 @@ class TestTokenCache:
         assert result is not None
         assert result.access_token == "second_token"
 
+    async def test_get_serves_unchanged_file_from_memory(
+        self, cache: TokenCache, cache_path: Path
+    ) -> None:
+        await cache.set("memory_token", expires_in=3600)
+        first = await cache.get()
+
+        # Corrupt the file without touching its mtime; the in-memory copy
+        # should still be served as long as the mtime is unchanged
+        stat = cache_path.stat()
+        cache_path.write_text("not valid json {{{")
+        import os
+
+        os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        second = await cache.get()
+
+        assert first is not None
+        assert second is not None
+        assert second.access_token == "memory_token"
+
+    async def test_get_rereads_file_when_mtime_changes(
+        self, cache: TokenCache, cache_path: Path
+    ) -> None:
+        await cache.set("old_token", expires_in=3600)
+        await cache.get()
+
+        # Simulate another process rewriting the cache file
+        new_data = {
+            "access_token": "new_token",
+            "expires_at": time.time() + 3600,
+        }
+        cache_path.write_text(json.dumps(new_data))
+        import os
+
+        os.utime(cache_path, ns=(0, 10**18))
+
+        result = await cache.get()
+
+        assert result is not None
+        assert result.access_token == "new_token"
+
     async def test_concurrent_access(self, cache: TokenCache, cache_path: Path) -> None:
         """Test that concurrent reads and writes don't corrupt data."""
         import asyncio